@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Fan-out benchmark for fire alert push notifications.
+
+Seeds a throwaway database with N recipients, starts the local FCM stand-in
+from fake_fcm.py and measures how long it takes to deliver one alert to every
+token: once by calling send_fire_alert_notification directly and once end to
+end through POST /api/alerts and the notification outbox.
+
+    python bench_fanout.py --users 10000 --latency-ms 80 --unregistered-rate 0.02
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import fake_fcm
+
+def seed_recipients(m, count, ranch_id, dead_fraction):
+    """Bulk insert recipients with FCM tokens; a fraction get unregistered tokens"""
+    dead_every = int(1 / dead_fraction) if dead_fraction > 0 else 0
+    rows = []
+    for i in range(count):
+        prefix = fake_fcm.UNREGISTERED_PREFIX if dead_every and i % dead_every == 0 else 'token-'
+        rows.append({
+            'name': f"Bench User {i}",
+            'email': f"bench{i}@ranch.local",
+            'fcm_token': f"{prefix}{i}",
+            'ranch_id': ranch_id
+        })
+    m.db.session.execute(m.db.insert(m.User), rows)
+    m.db.session.commit()
+
+def token_count(m, ranch_id):
+    return m.db.session.query(m.User).filter(
+        m.User.ranch_id == ranch_id,
+        m.User.fcm_token.isnot(None),
+        m.User.fcm_token != ''
+    ).count()
+
+def report(label, elapsed, tokens, server_stats_before, server_stats_after):
+    requests = server_stats_after['requests'] - server_stats_before['requests']
+    unregistered = server_stats_after['unregistered'] - server_stats_before['unregistered']
+    rate = tokens / elapsed if elapsed else 0
+    print(f"{label:<12} {elapsed * 1000:9.1f} ms  {tokens:7d} tokens  {rate:10.0f} tokens/s  "
+          f"{requests:4d} multicasts  {unregistered:6d} pruned")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark fire alert notification fan-out')
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--latency-ms', type=float, default=80)
+    parser.add_argument('--jitter-ms', type=float, default=20)
+    parser.add_argument('--unregistered-rate', type=float, default=0.01,
+                        help='fraction of seeded tokens that the stand-in reports as unregistered')
+    parser.add_argument('--timeout', type=float, default=120, help='seconds to wait for the outbox')
+    args = parser.parse_args()
+
+    server, url = fake_fcm.start_in_thread(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, seed=1)
+
+    # app.py keeps its database under ./data, so run it from a scratch directory
+    os.environ['MESSAGING_BACKEND'] = 'http'
+    os.environ['FCM_STANDIN_URL'] = url
+    os.environ.setdefault('OUTBOX_POLL_SECONDS', '1')
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(tempfile.mkdtemp(prefix='fanout-bench-'))
+
+    import app as m
+
+    # Database setup only; the dispatcher is started below for the end-to-end run
+    m.create_tables()
+    m.startup.ready.set()
+    with m.app.app_context():
+        ranch = m.Ranch.query.first()
+        admin = m.User.query.filter_by(is_admin=True).first()
+        ranch_id, admin_id = ranch.id, admin.id
+        seed_recipients(m, args.users, ranch_id, args.unregistered_rate)
+
+    print(f"Backend: {m.messaging_backend.name} at {url}, latency {args.latency_ms}ms +{args.jitter_ms}ms, "
+          f"{m.FCM_MAX_WORKERS} workers, {m.FCM_MULTICAST_LIMIT} tokens per multicast")
+
+    # Direct send: measures chunking, parallel sends and token pruning only
+    with m.app.app_context():
+        alert = m.FireAlert(title='Bench direct', message='Fan-out benchmark', ranch_id=ranch_id,
+                            severity='critical', created_by=admin_id)
+        m.db.session.add(alert)
+        m.db.session.commit()
+        tokens = token_count(m, ranch_id)
+        before = server.stats.as_dict()
+        started = time.perf_counter()
+        m.send_fire_alert_notification(alert)
+        report('direct', time.perf_counter() - started, tokens, before, server.stats.as_dict())
+
+    # End to end: API request, outbox row, dispatcher, scheduler lane, send
+    m.notification_dispatcher.start()
+    client = m.app.test_client()
+    with m.app.app_context():
+        tokens = token_count(m, ranch_id)
+    before = server.stats.as_dict()
+    started = time.perf_counter()
+    response = client.post('/api/alerts', json={
+        'title': 'Bench end to end',
+        'message': 'Fan-out benchmark',
+        'severity': 'critical',
+        'user_id': admin_id
+    })
+    accepted = time.perf_counter() - started
+    alert_id = response.get_json()['alert']['id']
+
+    status = None
+    while time.perf_counter() - started < args.timeout:
+        with m.app.app_context():
+            row = m.NotificationOutbox.query.filter_by(alert_id=alert_id).first()
+            status = row.status if row else None
+            m.db.session.remove()
+        if status in ('sent', 'skipped', 'failed'):
+            break
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    print(f"{'accepted':<12} {accepted * 1000:9.1f} ms  (POST /api/alerts response)")
+    report(f"outbox:{status}", elapsed, tokens, before, server.stats.as_dict())
+
+    m.notification_dispatcher.stop()
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Livestock matching benchmark.
+
+Generates N open requests and M helpers scattered around a ranch and times a
+full re-match with match_livestock_requests from app.py: with numpy when it is
+installed and with the plain Python fallback. Nothing touches the database.
+
+    python bench_matching.py --requests 400 --helpers 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+def make_inputs(m, request_count, helper_count, spread_degrees, seed):
+    rng = random.Random(seed)
+    center_lat, center_lon = 31.919, -109.9673
+    started = datetime(2024, 6, 1, 12, 0, 0)
+    requests = [{
+        'id': i + 1,
+        'user_id': None,
+        'animal_type': rng.choice(m.LIVESTOCK_ANIMAL_TYPES),
+        'animal_count': rng.randint(5, 200),
+        'urgency_level': rng.choice(list(m.LIVESTOCK_URGENCY_ORDER)),
+        'created_at': started + timedelta(minutes=i),
+        'latitude': center_lat + rng.uniform(-0.3, 0.3),
+        'longitude': center_lon + rng.uniform(-0.3, 0.3)
+    } for i in range(request_count)]
+    helpers = [{
+        'user_id': i + 1,
+        'name': f"Helper {i}",
+        'ranch_id': 1,
+        'latitude': center_lat + rng.uniform(-spread_degrees, spread_degrees),
+        'longitude': center_lon + rng.uniform(-spread_degrees, spread_degrees),
+        'pasture_head_count': rng.randint(0, 500),
+        'trailer_slots': {animal_type: rng.randint(1, 30) for animal_type in rng.sample(m.LIVESTOCK_ANIMAL_TYPES, 3)}
+    } for i in range(helper_count)]
+    return requests, helpers
+
+def timed(m, requests, helpers, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        matches = m.match_livestock_requests(requests, helpers)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, matches
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark livestock helper matching')
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--helpers', type=int, default=5000)
+    parser.add_argument('--spread', type=float, default=1.0, help='helpers are placed within this many degrees of the ranch')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement; the best is reported')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    # app.py keeps its database under ./data, so import it from a scratch directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(tempfile.mkdtemp(prefix='matching-bench-'))
+
+    import app as m
+
+    requests, helpers = make_inputs(m, args.requests, args.helpers, args.spread, args.seed)
+    print(f"{args.requests} requests x {args.helpers} helpers")
+
+    numpy_module = m.np
+    if numpy_module is not None:
+        elapsed, matches = timed(m, requests, helpers, args.repeat)
+        print(f"  numpy    {elapsed * 1000:8.1f} ms")
+    m.np = None
+    fallback, fallback_matches = timed(m, requests, helpers, 1)
+    m.np = numpy_module
+    print(f"  python   {fallback * 1000:8.1f} ms")
+    if numpy_module is not None:
+        print(f"  speedup  {fallback / elapsed:.1f}x, same ranking: {matches == fallback_matches}")
+
+    unmatched = sum(match['unmatched_head'] for match in fallback_matches)
+    print(f"  {sum(req['animal_count'] for req in requests)} head requested, {unmatched} without a suggested helper")
+
+if __name__ == '__main__':
+    main()
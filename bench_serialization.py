@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Serialization micro-benchmark for the JSON list endpoints.
+
+Builds N in-memory alerts, users and livestock requests and times turning
+them into a JSON response body two ways: the hand-written dict literals with
+isoformat() and Flask's default stdlib encoder the routes used before, and
+the model serializers with FastJSONProvider from app.py (orjson when it is
+installed). Reports microseconds per row for building the dicts, encoding
+them and both together.
+
+    python bench_serialization.py --rows 10000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from flask.json.provider import DefaultJSONProvider
+
+def make_rows(m, count):
+    """Transient model instances with their relationships filled in; nothing touches the database"""
+    ranch = m.Ranch(id=1, name='Dragoon Mountain Ranch', latitude=31.919, longitude=-109.9673, radius_miles=10.0)
+    started = datetime(2024, 6, 1, 12, 0, 0, 123456)
+    users, alerts, requests = [], [], []
+    for i in range(count):
+        at = started + timedelta(minutes=i)
+        user = m.User(id=i + 1, name=f"Rancher {i}", email=f"rancher{i}@ranch.local", phone=f"520555{i:04d}",
+                      ranch_id=1, is_admin=i % 50 == 0, home_latitude=31.9 + i * 1e-5, home_longitude=-109.9,
+                      last_login=at, created_at=at)
+        user.ranch = ranch
+        alert = m.FireAlert(id=i + 1, title=f"Smoke reported near gate {i}", message='Smoke visible from the north ridge, wind from the southwest.',
+                            ranch_id=1, severity='high', status='active', latitude=31.92, longitude=-109.95,
+                            created_by=user.id, created_at=at, updated_at=at)
+        alert.creator = user
+        alert.ranch = ranch
+        request = m.LivestockRequest(id=i + 1, user_id=user.id, ranch_id=1, animal_type='cattle', animal_count=40,
+                                     urgency_level='high', details='Need trailers for 40 head', status='open', created_at=at)
+        request.user = user
+        users.append(user)
+        alerts.append(alert)
+        requests.append(request)
+    return alerts, users, requests
+
+# The dict literals the routes built by hand before the serializers
+def alert_dict(alert):
+    return {
+        'id': alert.id,
+        'title': alert.title,
+        'message': alert.message,
+        'severity': alert.severity,
+        'status': alert.status,
+        'latitude': alert.latitude,
+        'longitude': alert.longitude,
+        'created_at': alert.created_at.isoformat(),
+        'updated_at': alert.updated_at.isoformat(),
+        'creator_name': alert.creator.name if alert.creator else 'Unknown User',
+        'ranch_name': alert.ranch.name if alert.ranch else 'Unknown Ranch',
+        'shared_with': sorted(share.ranch.name for share in alert.shares)
+    }
+
+def user_dict(u):
+    return {
+        'id': u.id,
+        'name': u.name,
+        'email': u.email,
+        'phone': u.phone,
+        'ranch_id': u.ranch_id,
+        'ranch_name': u.ranch.name if u.ranch else 'Unknown Ranch',
+        'is_admin': u.is_admin,
+        'last_login': u.last_login.isoformat() if u.last_login else None,
+        'created_at': u.created_at.isoformat() if u.created_at else None
+    }
+
+def request_dict(req):
+    return {
+        'id': req.id,
+        'user_id': req.user_id,
+        'user_name': req.user.name if req.user else 'Unknown User',
+        'animal_type': req.animal_type,
+        'animal_count': req.animal_count,
+        'urgency_level': req.urgency_level,
+        'details': req.details,
+        'status': req.status,
+        'created_at': req.created_at.isoformat()
+    }
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def measure(label, rows, build, provider, repeat):
+    build_time, payload = best_of(repeat, lambda: {'success': True, 'items': build(rows)})
+    encode_time, body = best_of(repeat, lambda: provider.dumps(payload))
+    per_row = lambda seconds: seconds / len(rows) * 1e6
+    print(f"  {label:<8} build {per_row(build_time):6.2f} us/row  encode {per_row(encode_time):6.2f} us/row  "
+          f"total {per_row(build_time + encode_time):6.2f} us/row  ({len(body) / 1024:.0f} KiB)")
+    return build_time + encode_time
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark JSON serialization of list endpoints')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement; the best is reported')
+    args = parser.parse_args()
+
+    # app.py keeps its database under ./data, so import it from a scratch directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(tempfile.mkdtemp(prefix='serialization-bench-'))
+
+    import app as m
+
+    before_provider = DefaultJSONProvider(m.app)
+    after_provider = m.app.json
+    print(f"{args.rows} rows, encoder: {'orjson' if m.orjson is not None else 'stdlib json'}")
+
+    alerts, users, requests = make_rows(m, args.rows)
+    for name, rows, build_before, serializer in (
+        ('alerts', alerts, alert_dict, m.alert_detail_serializer),
+        ('users', users, user_dict, m.admin_user_serializer),
+        ('livestock', requests, request_dict, m.livestock_request_serializer),
+    ):
+        print(name)
+        before = measure('before', rows, lambda rows: [build_before(row) for row in rows], before_provider, args.repeat)
+        after = measure('after', rows, serializer.many, after_provider, args.repeat)
+        print(f"  speedup  {before / after:.1f}x")
+
+if __name__ == '__main__':
+    main()
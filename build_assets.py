@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Fingerprint the static assets the page shell loads.
+
+Finds every asset_url('...') reference in templates/, copies each referenced
+file under static/ to static/dist with a content hash in its name and writes:
+
+    static/dist/manifest.json            source path -> fingerprinted path, read by asset_url()
+    static/dist/precache-manifest.js     the service worker's precache list and build id
+
+Fingerprinted files never change under the same name, so app.py serves them
+with a one-year immutable Cache-Control. Re-run after editing any of them:
+
+    python build_assets.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'static')
+TEMPLATES_DIR = os.path.join(ROOT, 'templates')
+DIST_NAME = 'dist'
+HASH_LENGTH = 12
+
+ASSET_REFERENCE = re.compile(r"""asset_url\(\s*['"]([^'"]+)['"]\s*\)""")
+
+# Precached alongside the fingerprinted files: the page shell, the web app manifest
+# and the icon notifications use, which keep their stable URLs
+PRECACHE_EXTRA = ['/', '/static/manifest.json', '/static/icons/icon-192.png']
+
+def referenced_assets(templates_dir):
+    """Source paths (relative to static/) named in asset_url() calls, in first-seen order"""
+    found = {}
+    for dirpath, _, filenames in os.walk(templates_dir):
+        for filename in sorted(filenames):
+            with open(os.path.join(dirpath, filename), encoding='utf-8') as f:
+                for source in ASSET_REFERENCE.findall(f.read()):
+                    found.setdefault(source, None)
+    return list(found)
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def fingerprinted_name(source, digest):
+    stem, ext = os.path.splitext(source)
+    return f"{DIST_NAME}/{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+def build(static_dir=STATIC_DIR, templates_dir=TEMPLATES_DIR):
+    sources = referenced_assets(templates_dir)
+    missing = [source for source in sources if not os.path.isfile(os.path.join(static_dir, source))]
+    if missing:
+        raise FileNotFoundError(f"Referenced assets not found under {static_dir}: {', '.join(missing)}")
+
+    # Write the new build next to the old one and swap, so a running server never sees a half-built dist
+    dist_dir = os.path.join(static_dir, DIST_NAME)
+    staging_dir = dist_dir + '.tmp'
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+    manifest = {}
+    for source in sources:
+        target = fingerprinted_name(source, file_digest(os.path.join(static_dir, source)))
+        manifest[source] = target
+        target_path = os.path.join(staging_dir, os.path.relpath(target, DIST_NAME))
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        shutil.copy2(os.path.join(static_dir, source), target_path)
+
+    # The build id changes whenever any fingerprinted file does, which retires the old SW caches
+    build_id = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest()[:HASH_LENGTH]
+    precache = PRECACHE_EXTRA + [f"/static/{target}" for target in manifest.values()]
+
+    os.makedirs(staging_dir, exist_ok=True)
+    with open(os.path.join(staging_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    with open(os.path.join(staging_dir, 'precache-manifest.js'), 'w') as f:
+        f.write('// Generated by build_assets.py - do not edit\n')
+        f.write(f"self.PRECACHE_BUILD_ID = {json.dumps(build_id)};\n")
+        f.write(f"self.PRECACHE_ASSETS = {json.dumps(precache, indent=4)};\n")
+
+    old_dir = dist_dir + '.old'
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.isdir(dist_dir):
+        os.rename(dist_dir, old_dir)
+    os.rename(staging_dir, dist_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return build_id, manifest
+
+def main():
+    parser = argparse.ArgumentParser(description='Fingerprint static assets and generate the service worker precache list')
+    parser.add_argument('--static-dir', default=STATIC_DIR)
+    parser.add_argument('--templates-dir', default=TEMPLATES_DIR)
+    args = parser.parse_args()
+
+    try:
+        build_id, manifest = build(args.static_dir, args.templates_dir)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    for source, target in manifest.items():
+        print(f"  {source:<24} -> static/{target}")
+    print(f"✅ Built {len(manifest)} assets, build {build_id}")
+
+if __name__ == '__main__':
+    main()
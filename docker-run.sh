@@ -135,9 +135,11 @@ create_backup() {
 import os
 import sys
 sys.path.append('/app')
-from app import create_backup
-create_backup()
-print('Backup created successfully!')
+from app import backup_database
+backup_file = backup_database()
+if not backup_file:
+    sys.exit('Backup failed')
+print(f'Backup created successfully: {backup_file}')
 "
     else
         print_warning "No containers are currently running."
@@ -150,17 +152,28 @@ restore_backup() {
     read -r response
     if [[ "$response" =~ ^([yY][eE][sS]|[yY])$ ]]; then
         print_status "Restoring database from backup..."
-        if docker compose ps | grep -q "Up"; then
-            docker compose exec web python -c "
-import os
+        # The database file is swapped out, so nothing may have it open: stop the web
+        # server, restore from a one-off container on the same volume, then start it again
+        web_was_running=false
+        if docker compose ps web | grep -q "Up"; then
+            web_was_running=true
+            docker compose stop web
+        fi
+        restore_status=0
+        docker compose run --rm --no-deps web python -c "
 import sys
 sys.path.append('/app')
-from app import restore_backup
-restore_backup()
+from app import app, latest_backup_file, restore_database
+with app.app_context():
+    if not restore_database(latest_backup_file()):
+        sys.exit('Restore failed')
 print('Backup restored successfully!')
-"
-        else
-            print_warning "No containers are currently running."
+" || restore_status=$?
+        if [ "$web_was_running" = true ]; then
+            docker compose start web
+        fi
+        if [ $restore_status -ne 0 ]; then
+            print_error "Restore failed; the database was left unchanged."
         fi
     else
         print_status "Restore operation cancelled."
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Local FCM stand-in for load testing push notification fan-out.
+
+Accepts the multicast payloads sent by HttpMessagingBackend in app.py and
+answers with per-token results, with optional injected latency, request
+failures and unregistered tokens. Run it standalone and point the app at it:
+
+    python fake_fcm.py --port 8089 --latency-ms 80
+    MESSAGING_BACKEND=http FCM_STANDIN_URL=http://127.0.0.1:8089 python app.py
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Tokens starting with this prefix are always reported as unregistered
+UNREGISTERED_PREFIX = 'unregistered-'
+
+class FakeFCMOptions:
+    def __init__(self, latency_ms=50, jitter_ms=0, error_rate=0.0, unregistered_rate=0.0, max_tokens=500, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.unregistered_rate = unregistered_rate
+        self.max_tokens = max_tokens
+        self.random = random.Random(seed)
+
+class FakeFCMStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failed_requests = 0
+        self.tokens = 0
+        self.unregistered = 0
+
+    def as_dict(self):
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'failed_requests': self.failed_requests,
+                'tokens': self.tokens,
+                'unregistered': self.unregistered
+            }
+
+class FakeFCMHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, self.server.stats.as_dict())
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if self.path != '/v1/multicast':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        options = self.server.options
+        stats = self.server.stats
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        tokens = payload.get('tokens', [])
+
+        delay = options.latency_ms + options.random.uniform(0, options.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        if len(tokens) > options.max_tokens:
+            self._send_json(400, {'error': f'At most {options.max_tokens} tokens per multicast'})
+            return
+
+        if options.random.random() < options.error_rate:
+            with stats.lock:
+                stats.requests += 1
+                stats.failed_requests += 1
+            self._send_json(503, {'error': 'Injected failure'})
+            return
+
+        responses = []
+        unregistered = 0
+        for token in tokens:
+            if token.startswith(UNREGISTERED_PREFIX) or options.random.random() < options.unregistered_rate:
+                responses.append({'success': False, 'error': 'UNREGISTERED'})
+                unregistered += 1
+            else:
+                responses.append({'success': True})
+
+        with stats.lock:
+            stats.requests += 1
+            stats.tokens += len(tokens)
+            stats.unregistered += unregistered
+
+        self._send_json(200, {
+            'success_count': len(tokens) - unregistered,
+            'failure_count': unregistered,
+            'responses': responses
+        })
+
+def make_server(host='127.0.0.1', port=8089, **options):
+    """Create (but do not start) a fake FCM server; port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), FakeFCMHandler)
+    server.daemon_threads = True
+    server.options = FakeFCMOptions(**options)
+    server.stats = FakeFCMStats()
+    return server
+
+def start_in_thread(host='127.0.0.1', port=0, **options):
+    """Start a fake FCM server on a background thread; returns (server, base_url)"""
+    server = make_server(host, port, **options)
+    threading.Thread(target=server.serve_forever, name='fake-fcm', daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+def main():
+    parser = argparse.ArgumentParser(description='Local FCM stand-in for notification load tests')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency-ms', type=float, default=50, help='base latency per multicast request')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='extra random latency per request')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with HTTP 503')
+    parser.add_argument('--unregistered-rate', type=float, default=0.0, help='fraction of tokens reported unregistered')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = make_server(
+        args.host, args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        unregistered_rate=args.unregistered_rate,
+        seed=args.seed
+    )
+    logger.info(f"Fake FCM listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
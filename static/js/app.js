@@ -0,0 +1,2949 @@
+// Global variables
+let currentUser = null;
+let deferredPrompt = null;
+let swRegistration = null;
+
+// Retry API calls the server turned away while it was still starting up
+const nativeFetch = window.fetch.bind(window);
+window.fetch = async function(resource, options) {
+    for (let attempt = 0; ; attempt++) {
+        const response = await nativeFetch(resource, options);
+        const retryAfter = response.headers.get('Retry-After');
+        if (response.status !== 503 || !retryAfter || attempt >= 5) {
+            return response;
+        }
+        await new Promise(resolve => setTimeout(resolve, parseInt(retryAfter, 10) * 1000));
+    }
+};
+
+// Initialize app when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    checkConnection();
+    setupPWA();
+    loadConfig();
+    
+    // Check for existing session
+    const savedUser = localStorage.getItem('ranchFireAlertUser');
+    if (savedUser) {
+        try {
+            currentUser = JSON.parse(savedUser);
+            // Validate session with server
+            validateSession();
+        } catch (error) {
+            console.error('Error loading saved session:', error);
+            localStorage.removeItem('ranchFireAlertUser');
+            showUserCheck();
+        }
+    } else {
+        showUserCheck();
+    }
+    
+    // Set up periodic tasks
+    setInterval(checkConnection, 10000);
+    
+    // Periodic service worker update check (more frequent for mobile)
+    setInterval(() => {
+        if (swRegistration) {
+            swRegistration.update().catch(error => {
+                console.log('Service Worker update check failed:', error);
+            });
+        }
+    }, 1000 * 60 * 5); // Check every 5 minutes
+    
+    // Periodic PWA installation check (in case beforeinstallprompt was missed)
+    setInterval(() => {
+        if (!deferredPrompt && !window.matchMedia('(display-mode: standalone)').matches) {
+            // Check if user has already dismissed the install prompt for this session
+            const hasDismissedInstall = localStorage.getItem('pwaInstallDismissed');
+            if (!hasDismissedInstall) {
+                checkPWACriteria();
+            }
+        }
+    }, 30000); // Check every 30 seconds
+    
+    // Initial PWA check after a short delay to ensure everything is loaded
+    setTimeout(() => {
+        console.log('Performing initial PWA criteria check...');
+        checkPWACriteria();
+    }, 2000);
+    
+    // Force update check on page visibility change (when user returns to app)
+    document.addEventListener('visibilitychange', () => {
+        if (!document.hidden && swRegistration) {
+            console.log('Page became visible, checking for updates...');
+            swRegistration.update().catch(error => {
+                console.log('Service Worker update check failed:', error);
+            });
+        }
+    });
+});
+
+// Load configuration from backend
+async function loadConfig() {
+    try {
+        const response = await fetch('/api/config');
+        const config = await response.json();
+        
+        if (config.firebase && config.firebase.apiKey !== 'demo-api-key') {
+            initializeFirebase(config);
+        } else {
+            console.log('Firebase configuration not available - PWA features limited');
+        }
+    } catch (error) {
+        console.error('Error loading config:', error);
+    }
+}
+
+// Initialize Firebase
+function initializeFirebase(config) {
+    try {
+        if (window.initializeFirebaseApp && window.initializeFirebaseApp(config)) {
+            
+            if ('serviceWorker' in navigator) {
+                // Register both service workers
+                Promise.all([
+                    navigator.serviceWorker.register('/static/sw.js'),
+                    navigator.serviceWorker.register('/firebase-messaging-sw.js')
+                ]).then(([swReg, firebaseReg]) => {
+                    swRegistration = swReg;
+                    console.log('Service Workers registered successfully');
+                    setupServiceWorkerUpdates(swReg);
+                    updateVersionDisplay();
+                    setupMessaging(config.vapidKey);
+                }).catch(error => {
+                    console.error('Service Worker registration failed:', error);
+                    // Continue without service workers
+                    setupMessaging(config.vapidKey);
+                });
+            } else {
+                setupMessaging(config.vapidKey);
+            }
+        } else {
+            console.log('Firebase initialization failed');
+        }
+    } catch (error) {
+        console.error('Firebase initialization error:', error);
+    }
+}
+
+// Set up service worker update handling
+function setupServiceWorkerUpdates(registration) {
+    let refreshing = false;
+    
+    // Handle service worker updates
+    registration.addEventListener('updatefound', () => {
+        console.log('Service Worker update found');
+        const newWorker = registration.installing;
+        
+        newWorker.addEventListener('statechange', () => {
+            if (newWorker.state === 'installed' && navigator.serviceWorker.controller) {
+                // New service worker is installed and ready
+                showUpdateNotification();
+            }
+        });
+    });
+    
+    // Handle controller change (when new service worker takes over)
+    navigator.serviceWorker.addEventListener('controllerchange', () => {
+        if (!refreshing) {
+            refreshing = true;
+            console.log('New service worker activated, refreshing page...');
+            window.location.reload();
+        }
+    });
+    
+    // Check for updates periodically
+    setInterval(() => {
+        registration.update().catch(error => {
+            console.log('Service Worker update check failed:', error);
+        });
+    }, 1000 * 60 * 60); // Check every hour
+}
+
+// Show update notification to user
+function showUpdateNotification() {
+    // Remove any existing notification
+    const existingNotification = document.getElementById('updateNotification');
+    if (existingNotification) {
+        existingNotification.remove();
+    }
+    
+    // Show update indicator in connection status pane
+    const updateIndicator = document.getElementById('updateIndicator');
+    if (updateIndicator) {
+        updateIndicator.style.display = 'inline';
+    }
+    
+    // Create update notification element
+    const updateNotification = document.createElement('div');
+    updateNotification.id = 'updateNotification';
+    updateNotification.className = 'card';
+    updateNotification.style.cssText = `
+        position: fixed;
+        top: 20px;
+        left: 50%;
+        transform: translateX(-50%);
+        z-index: 10000;
+        max-width: 90%;
+        width: 400px;
+        background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
+        color: white;
+        box-shadow: 0 10px 25px -5px rgba(59, 130, 246, 0.4);
+        animation: slideIn 0.3s ease-out;
+        border: none;
+    `;
+    
+    updateNotification.innerHTML = `
+        <div style="text-align: center;">
+            <h4 style="margin: 0 0 12px 0; font-size: 18px; font-weight: 600;">🔄 App Update Available</h4>
+            <p style="margin: 0 0 16px 0; font-size: 14px; opacity: 0.9;">A new version with improved layout is ready to install</p>
+            <div style="display: flex; gap: 12px; justify-content: center;">
+                <button id="updateNowBtn" style="
+                    background: rgba(255,255,255,0.2);
+                    border: 1px solid rgba(255,255,255,0.3);
+                    color: white;
+                    padding: 10px 20px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    font-weight: 600;
+                    font-size: 14px;
+                    transition: all 0.2s ease;
+                    flex: 1;
+                    max-width: 120px;
+                " onmouseover="this.style.background='rgba(255,255,255,0.3)'" 
+                   onmouseout="this.style.background='rgba(255,255,255,0.2)'">
+                    Update Now
+                </button>
+                <button id="refreshBtn" style="
+                    background: rgba(255,255,255,0.1);
+                    border: 1px solid rgba(255,255,255,0.2);
+                    color: white;
+                    padding: 10px 20px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    font-weight: 600;
+                    font-size: 14px;
+                    transition: all 0.2s ease;
+                    flex: 1;
+                    max-width: 120px;
+                " onmouseover="this.style.background='rgba(255,255,255,0.2)'" 
+                   onmouseout="this.style.background='rgba(255,255,255,0.1)'">
+                    Refresh
+                </button>
+            </div>
+        </div>
+    `;
+    
+    // Add event listeners to buttons
+    setTimeout(() => {
+        const updateNowBtn = document.getElementById('updateNowBtn');
+        const refreshBtn = document.getElementById('refreshBtn');
+        
+        if (updateNowBtn) {
+            updateNowBtn.addEventListener('click', function(e) {
+                e.preventDefault();
+                e.stopPropagation();
+                console.log('Update Now button clicked');
+                applyUpdate();
+            });
+        }
+        
+        if (refreshBtn) {
+            refreshBtn.addEventListener('click', function(e) {
+                e.preventDefault();
+                e.stopPropagation();
+                console.log('Refresh button clicked');
+                manualRefresh();
+            });
+        }
+    }, 100);
+    
+    // Add CSS animation
+    const style = document.createElement('style');
+    style.textContent = `
+        @keyframes slideIn {
+            from {
+                transform: translateX(-50%) translateY(-100%);
+                opacity: 0;
+            }
+            to {
+                transform: translateX(-50%) translateY(0);
+                opacity: 1;
+            }
+        }
+        @keyframes slideOut {
+            from {
+                transform: translateX(-50%) translateY(0);
+                opacity: 1;
+            }
+            to {
+                transform: translateX(-50%) translateY(-100%);
+                opacity: 0;
+            }
+        }
+    `;
+    document.head.appendChild(style);
+    
+    // Add to page
+    document.body.appendChild(updateNotification);
+    
+    // Auto-hide after 60 seconds (longer for mobile)
+    setTimeout(() => {
+        if (updateNotification.parentNode) {
+            updateNotification.style.animation = 'slideOut 0.3s ease-in';
+            setTimeout(() => {
+                if (updateNotification.parentNode) {
+                    updateNotification.remove();
+                }
+            }, 300);
+        }
+    }, 60000);
+}
+
+// Manual refresh function
+function manualRefresh() {
+    console.log('Manual refresh triggered');
+    console.log('Current URL:', window.location.href);
+    console.log('Service Worker registration:', swRegistration ? 'available' : 'not available');
+    
+    try {
+        // Show a brief loading message
+        const updateIndicator = document.getElementById('updateIndicator');
+        if (updateIndicator) {
+            updateIndicator.textContent = '🔄 Refreshing...';
+            updateIndicator.style.color = '#10b981';
+        }
+        
+        // Try to clear any caches first
+        if ('caches' in window) {
+            caches.keys().then(cacheNames => {
+                console.log('Found caches:', cacheNames);
+                return Promise.all(
+                    cacheNames.map(cacheName => {
+                        console.log('Deleting cache:', cacheName);
+                        return caches.delete(cacheName);
+                    })
+                );
+            }).then(() => {
+                console.log('Caches cleared, reloading page...');
+                // Small delay to show the "Refreshing..." message
+                setTimeout(() => {
+                    window.location.reload();
+                }, 500);
+            }).catch(error => {
+                console.error('Error clearing caches:', error);
+                window.location.reload();
+            });
+        } else {
+            console.log('Cache API not available, reloading directly...');
+            window.location.reload();
+        }
+    } catch (error) {
+        console.error('Error in manual refresh:', error);
+        // Fallback to simple reload
+        window.location.reload();
+    }
+}
+
+// Make manualRefresh globally accessible
+window.manualRefresh = manualRefresh;
+
+// Apply service worker update
+function applyUpdate() {
+    if (swRegistration && swRegistration.waiting) {
+        // Hide update indicator
+        const updateIndicator = document.getElementById('updateIndicator');
+        if (updateIndicator) {
+            updateIndicator.style.display = 'none';
+        }
+        
+        // Send message to service worker to skip waiting
+        swRegistration.waiting.postMessage({ type: 'SKIP_WAITING' });
+        
+        // Show loading state
+        const updateNotification = document.getElementById('updateNotification');
+        if (updateNotification) {
+            updateNotification.innerHTML = `
+                <div style="text-align: center; padding: 20px;">
+                    <div class="loading" style="margin: 0 auto 12px auto;"></div>
+                    <p style="margin: 0; font-size: 14px;">Updating...</p>
+                </div>
+            `;
+        }
+    }
+}
+
+// Update version display
+function updateVersionDisplay() {
+    // Update app version
+    const appVersionElement = document.getElementById('appVersion');
+    if (appVersionElement) {
+        appVersionElement.textContent = 'App v1.0.0';
+    }
+    
+    // Update service worker version
+    if (swRegistration && swRegistration.active) {
+        const channel = new MessageChannel();
+        channel.port1.onmessage = (event) => {
+            const swVersionElement = document.getElementById('swVersion');
+            if (swVersionElement && event.data.version) {
+                swVersionElement.textContent = `SW v${event.data.version}`;
+            }
+        };
+        
+        swRegistration.active.postMessage({ type: 'GET_VERSION' }, [channel.port2]);
+    }
+    
+    // Check for waiting service worker
+    checkForWaitingServiceWorker();
+}
+
+// Check for waiting service worker and show indicator
+function checkForWaitingServiceWorker() {
+    if (swRegistration && swRegistration.waiting) {
+        const updateIndicator = document.getElementById('updateIndicator');
+        if (updateIndicator) {
+            updateIndicator.style.display = 'inline';
+        }
+    }
+}
+
+// Set up Firebase messaging
+function setupMessaging(vapidKey) {
+    if (!window.firebaseMessaging || !window.setupFirebaseMessaging) return;
+    
+    // Handle foreground messages
+    window.setupFirebaseMessaging((payload) => {
+        const notificationTitle = payload.notification?.title || 'Fire Alert';
+        const notificationOptions = {
+            body: payload.notification?.body || 'New alert received',
+            icon: '/static/icons/icon-192.png',
+            badge: '/static/icons/icon-192.png',
+            tag: 'fire-alert',
+            requireInteraction: true
+        };
+        
+        if (swRegistration) {
+            swRegistration.showNotification(notificationTitle, notificationOptions);
+        }
+        
+        // Refresh alerts if we're on the alerts tab
+        if (!document.getElementById('alertsTab').classList.contains('hidden')) {
+            loadAlerts();
+        }
+    });
+}
+
+// Request notification permission and get token
+async function requestNotificationPermission() {
+    console.log('requestNotificationPermission started');
+    
+    if (!window.getFirebaseToken) {
+        console.log('Firebase not available - skipping notification setup');
+        return null;
+    }
+    
+    try {
+        console.log('Loading config to get VAPID key...');
+        // Load config to get VAPID key
+        const response = await fetch('/api/config');
+        const config = await response.json();
+        console.log('Config loaded, VAPID key available:', !!config.vapidKey);
+        
+        if (config.vapidKey && config.vapidKey !== 'demo-vapid-key') {
+            console.log('Getting Firebase token...');
+            const token = await window.getFirebaseToken(config.vapidKey);
+            console.log('Firebase token received:', token ? 'yes' : 'no');
+            return token;
+        } else {
+            console.log('VAPID key not configured - skipping notifications');
+            return null;
+        }
+    } catch (error) {
+        console.error('Error setting up notifications:', error);
+        return null;
+    }
+}
+
+// PWA Installation
+function setupPWA() {
+    console.log('Setting up PWA installation...');
+    
+    // Check if PWA is already installed
+    if (window.matchMedia('(display-mode: standalone)').matches || 
+        window.navigator.standalone === true) {
+        console.log('PWA is already installed');
+        return;
+    }
+    
+    // Check if browser supports PWA installation
+    if (!('serviceWorker' in navigator)) {
+        console.log('Service Worker not supported - PWA installation not available');
+        return;
+    }
+    
+    // Check if user has already dismissed the install prompt for this session
+    const hasDismissedInstall = localStorage.getItem('pwaInstallDismissed');
+    if (hasDismissedInstall) {
+        console.log('User has already dismissed PWA install prompt for this session');
+        return;
+    }
+    
+    // Listen for beforeinstallprompt event
+    window.addEventListener('beforeinstallprompt', (e) => {
+        console.log('beforeinstallprompt event fired');
+        e.preventDefault();
+        deferredPrompt = e;
+        
+        // Show install prompt
+        showInstallPrompt();
+    });
+    
+    // Handle app installed event
+    window.addEventListener('appinstalled', (e) => {
+        console.log('PWA was installed');
+        hideInstallPrompt();
+        deferredPrompt = null;
+    });
+    
+    // Check if we missed the beforeinstallprompt event
+    // This can happen if the event fires before our listener is attached
+    setTimeout(() => {
+        if (!deferredPrompt) {
+            console.log('No beforeinstallprompt event received - checking PWA criteria');
+            checkPWACriteria();
+        }
+    }, 1000);
+}
+
+// Show install prompt
+function showInstallPrompt() {
+    const installPrompt = document.getElementById('installPrompt');
+    if (installPrompt) {
+        installPrompt.classList.remove('hidden');
+        console.log('Install prompt shown');
+    } else {
+        console.error('Install prompt element not found');
+    }
+}
+
+// Hide install prompt
+function hideInstallPrompt() {
+    const installPrompt = document.getElementById('installPrompt');
+    if (installPrompt) {
+        installPrompt.classList.add('hidden');
+        console.log('Install prompt hidden');
+        
+        // Remember that user dismissed the install prompt for this session
+        localStorage.setItem('pwaInstallDismissed', 'true');
+    }
+}
+
+// Check PWA installation criteria
+function checkPWACriteria() {
+    console.log('Checking PWA installation criteria...');
+    
+    // Check for manifest
+    const manifestLink = document.querySelector('link[rel="manifest"]');
+    const hasManifest = !!manifestLink;
+    
+    // Check for service worker support
+    const hasServiceWorker = 'serviceWorker' in navigator;
+    
+    // Check for HTTPS or localhost
+    const isHTTPS = location.protocol === 'https:' || location.hostname === 'localhost';
+    
+    // Check for icons with sizes
+    const icon192 = document.querySelector('link[rel="icon"][sizes="192x192"]');
+    const icon512 = document.querySelector('link[rel="icon"][sizes="512x512"]');
+    const hasIcons = !!(icon192 || icon512);
+    
+    // Check if not already installed
+    const isNotAlreadyInstalled = !window.matchMedia('(display-mode: standalone)').matches && window.navigator.standalone !== true;
+    
+    const criteria = {
+        hasManifest,
+        hasServiceWorker,
+        isHTTPS,
+        hasIcons,
+        isNotAlreadyInstalled
+    };
+    
+    console.log('PWA Criteria:', criteria);
+    console.log('Icon details:', {
+        icon192: icon192?.href,
+        icon512: icon512?.href,
+        allIcons: Array.from(document.querySelectorAll('link[rel="icon"]')).map(icon => ({
+            href: icon.href,
+            sizes: icon.sizes?.value,
+            type: icon.type
+        }))
+    });
+    
+    // If all criteria are met but no prompt, try to show manual install option
+    if (Object.values(criteria).every(Boolean)) {
+        // Check if user has already dismissed the install prompt for this session
+        const hasDismissedInstall = localStorage.getItem('pwaInstallDismissed');
+        if (hasDismissedInstall) {
+            console.log('User has already dismissed PWA install prompt for this session');
+            return;
+        }
+        
+        console.log('All PWA criteria met - showing manual install option');
+        showManualInstallOption();
+    } else {
+        const failedCriteria = Object.entries(criteria).filter(([, met]) => !met);
+        console.log('PWA criteria not met:', failedCriteria);
+        
+        // Provide specific guidance for failed criteria
+        failedCriteria.forEach(([criterion, met]) => {
+            if (!met) {
+                switch (criterion) {
+                    case 'hasManifest':
+                        console.warn('Missing manifest.json link');
+                        break;
+                    case 'hasServiceWorker':
+                        console.warn('Service Worker not supported in this browser');
+                        break;
+                    case 'isHTTPS':
+                        console.warn('HTTPS required for PWA installation');
+                        break;
+                    case 'hasIcons':
+                        console.warn('Missing icon links with sizes attribute');
+                        break;
+                    case 'isNotAlreadyInstalled':
+                        console.warn('PWA is already installed');
+                        break;
+                }
+            }
+        });
+    }
+}
+
+// Show manual install option for browsers that don't support beforeinstallprompt
+function showManualInstallOption() {
+    const installPrompt = document.getElementById('installPrompt');
+    if (installPrompt && !deferredPrompt) {
+        installPrompt.innerHTML = `
+            <p><strong>🏜️ Add to Home Screen</strong></p>
+            <p>This app can be installed on your device for quick access and offline use.</p>
+            <div style="margin: 15px 0; padding: 12px; background: rgba(255,255,255,0.1); border-radius: 8px;">
+                <p style="margin: 0 0 8px 0; font-size: 14px;"><strong>Installation Instructions:</strong></p>
+                <p style="margin: 0; font-size: 13px;">
+                    <strong>Chrome/Edge:</strong> Tap the menu (⋮) → "Add to Home screen"<br>
+                    <strong>Safari:</strong> Tap the share button → "Add to Home Screen"<br>
+                    <strong>Firefox:</strong> Tap the menu (☰) → "Install App"
+                </p>
+            </div>
+            <button class="btn btn-success" onclick="hideInstallPrompt()">Got it!</button>
+        `;
+        installPrompt.classList.remove('hidden');
+    }
+}
+
+// Install PWA
+async function installPWA() {
+    console.log('Install PWA function called');
+    
+    if (deferredPrompt) {
+        try {
+            console.log('Showing native install prompt...');
+            deferredPrompt.prompt();
+            const { outcome } = await deferredPrompt.userChoice;
+            
+            console.log('Install prompt outcome:', outcome);
+            
+            if (outcome === 'accepted') {
+                console.log('User accepted the install prompt');
+                showSuccess('App installed successfully!');
+            } else {
+                console.log('User dismissed the install prompt');
+            }
+        } catch (error) {
+            console.error('Error during PWA installation:', error);
+            showError('Installation failed. Please try again.');
+        } finally {
+            deferredPrompt = null;
+            hideInstallPrompt();
+        }
+    } else {
+        console.log('No deferred prompt available');
+        showManualInstallOption();
+    }
+}
+
+// Connection status check
+function checkConnection() {
+    const indicator = document.getElementById('connectionStatus');
+    const text = document.getElementById('connectionText');
+    
+    if (navigator.onLine) {
+        indicator.className = 'status-indicator status-online';
+        text.textContent = 'Connected';
+    } else {
+        indicator.className = 'status-indicator status-offline';
+        text.textContent = 'Offline';
+    }
+}
+
+// Utility functions
+function hideAllForms() {
+    const forms = ['userCheckForm', 'loginForm', 'registrationForm', 'mainApp'];
+    forms.forEach(form => {
+        document.getElementById(form).classList.add('hidden');
+    });
+}
+
+function showError(message) {
+    const errorDisplay = document.getElementById('errorDisplay');
+    const errorMessage = document.getElementById('errorMessage');
+    
+    errorMessage.textContent = message;
+    errorDisplay.classList.remove('hidden');
+    
+    // Hide success message
+    document.getElementById('successDisplay').classList.add('hidden');
+    
+    // Auto-hide after 5 seconds
+    setTimeout(() => {
+        errorDisplay.classList.add('hidden');
+    }, 5000);
+}
+
+function showSuccess(message) {
+    const successDisplay = document.getElementById('successDisplay');
+    const successMessage = document.getElementById('successMessage');
+    
+    successMessage.textContent = message;
+    successDisplay.classList.remove('hidden');
+    
+    // Hide error message
+    document.getElementById('errorDisplay').classList.add('hidden');
+    
+    // Auto-hide after 3 seconds
+    setTimeout(() => {
+        successDisplay.classList.add('hidden');
+    }, 3000);
+}
+
+function setLoading(elementId, isLoading) {
+    const btn = document.getElementById(elementId);
+    const loading = document.getElementById(elementId.replace('Btn', 'Loading'));
+    
+    if (isLoading) {
+        btn.classList.add('hidden');
+        loading.classList.remove('hidden');
+    } else {
+        btn.classList.remove('hidden');
+        loading.classList.add('hidden');
+    }
+}
+
+function showLoading(loadingId, buttonId) {
+    const btn = document.getElementById(buttonId);
+    const loading = document.getElementById(loadingId);
+    
+    if (btn) btn.classList.add('hidden');
+    if (loading) loading.classList.remove('hidden');
+}
+
+function hideLoading(loadingId, buttonId) {
+    const btn = document.getElementById(buttonId);
+    const loading = document.getElementById(loadingId);
+    
+    if (btn) btn.classList.remove('hidden');
+    if (loading) loading.classList.add('hidden');
+}
+
+// Authentication functions
+function showUserCheck() {
+    hideAllForms();
+    document.getElementById('userCheckForm').classList.remove('hidden');
+    document.getElementById('userIdentifier').value = '';
+    document.getElementById('userIdentifier').focus();
+}
+
+async function checkUser() {
+    const identifier = document.getElementById('userIdentifier').value.trim();
+    
+    if (!identifier) {
+        showError('Please enter your email or phone number');
+        return;
+    }
+    
+    setLoading('checkUserBtn', true);
+    
+    try {
+        const response = await fetch('/api/check-user', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ identifier })
+        });
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            if (result.exists) {
+                showLogin(result.user);
+            } else {
+                showRegistration(identifier);
+            }
+        } else {
+            throw new Error(result.error || 'User check failed');
+        }
+        
+    } catch (error) {
+        console.error('Check user error:', error);
+        showError('Error checking user: ' + error.message);
+    } finally {
+        setLoading('checkUserBtn', false);
+    }
+}
+
+function showLogin(userData) {
+    hideAllForms();
+    
+    const loginForm = document.getElementById('loginForm');
+    const userInfo = document.getElementById('existingUserInfo');
+    
+    userInfo.innerHTML = `
+        <h4>${userData.name}</h4>
+        <p style="margin: 5px 0; color: #666;">${userData.email || userData.phone}</p>
+        <p style="margin: 5px 0; color: #666;">${userData.ranch_name}</p>
+    `;
+    
+    loginForm.classList.remove('hidden');
+    document.getElementById('loginPassword').focus();
+}
+
+async function login() {
+    console.log('Login function started');
+    const password = document.getElementById('loginPassword').value;
+    
+    // Get identifier from the user check form since currentUser might not be set yet
+    const identifier = document.getElementById('userIdentifier').value.trim();
+    
+    if (!identifier) {
+        showError('Please enter your email or phone number');
+        return;
+    }
+    
+    try {
+        console.log('Showing loading state...');
+        showLoading('loginLoading', 'loginBtn');
+        
+        console.log('Making login request...');
+        const response = await fetch('/api/login', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                identifier: identifier,
+                password: password,
+                fcm_token: null // Skip FCM token for now
+            })
+        });
+        
+        console.log('Login response received, status:', response.status);
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        console.log('Login result:', result.success ? 'success' : 'failed');
+        
+        if (result.success) {
+            console.log('Login successful, updating user data...');
+            currentUser = result.user;
+            localStorage.setItem('ranchFireAlertUser', JSON.stringify(currentUser));
+            
+            // Request notification permission
+            if ('Notification' in window && Notification.permission === 'default') {
+                console.log('Requesting notification permission...');
+                Notification.requestPermission().then(permission => {
+                    console.log('Notification permission:', permission);
+                });
+            }
+            
+            console.log('Showing main app...');
+            showMainApp();
+        } else {
+            throw new Error(result.error || 'Login failed');
+        }
+        
+    } catch (error) {
+        console.error('Login error:', error);
+        showError('Login failed: ' + error.message);
+    } finally {
+        console.log('Login function finished, hiding loading state...');
+        hideLoading('loginLoading', 'loginBtn');
+    }
+}
+
+function showRegistration(identifier = '') {
+    hideAllForms();
+    loadRanches();
+    
+    const registrationForm = document.getElementById('registrationForm');
+    
+    // Pre-fill identifier if provided
+    if (identifier) {
+        if (identifier.includes('@')) {
+            document.getElementById('regEmail').value = identifier;
+        } else {
+            document.getElementById('regPhone').value = identifier;
+        }
+    }
+    
+    registrationForm.classList.remove('hidden');
+    document.getElementById('regName').focus();
+}
+
+async function loadRanches() {
+    try {
+        const response = await fetch('/api/ranches');
+        const result = await response.json();
+        
+        if (result.success) {
+            const ranchSelect = document.getElementById('regRanch');
+            const targetRanchSelect = document.getElementById('targetRanch');
+            const exportRanchSelect = document.getElementById('exportRanch');
+            
+            // Clear existing options (except first)
+            ranchSelect.innerHTML = '<option value="">Choose your ranch...</option>';
+            if (targetRanchSelect) {
+                targetRanchSelect.innerHTML = '<option value="all">All Ranches</option>';
+            }
+            if (exportRanchSelect) {
+                exportRanchSelect.innerHTML = '<option value="">All Ranches</option>';
+            }
+            
+            result.ranches.forEach(ranch => {
+                const option = document.createElement('option');
+                option.value = ranch.id;
+                option.textContent = ranch.name;
+                ranchSelect.appendChild(option);
+                
+                if (targetRanchSelect) {
+                    const targetOption = document.createElement('option');
+                    targetOption.value = ranch.id;
+                    targetOption.textContent = ranch.name;
+                    targetRanchSelect.appendChild(targetOption);
+                }
+                
+                if (exportRanchSelect) {
+                    const exportOption = document.createElement('option');
+                    exportOption.value = ranch.id;
+                    exportOption.textContent = ranch.name;
+                    exportRanchSelect.appendChild(exportOption);
+                }
+            });
+        } else {
+            console.error('Failed to load ranches:', result.error);
+        }
+    } catch (error) {
+        console.error('Error loading ranches:', error);
+    }
+}
+
+async function register() {
+    const name = document.getElementById('regName').value.trim();
+    const email = document.getElementById('regEmail').value.trim();
+    const phone = document.getElementById('regPhone').value.trim();
+    const password = document.getElementById('regPassword').value;
+    const ranchId = document.getElementById('regRanch').value;
+    
+    // Validation
+    if (!name) {
+        showError('Please enter your full name');
+        return;
+    }
+    
+    if (!email && !phone) {
+        showError('Please enter either an email or phone number');
+        return;
+    }
+    
+    if (!ranchId) {
+        showError('Please select your ranch');
+        return;
+    }
+    
+    setLoading('registerBtn', true);
+    
+    try {
+        // Get FCM token for notifications
+        const fcmToken = await requestNotificationPermission();
+        
+        const response = await fetch('/api/register', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                name,
+                email: email || null,
+                phone: phone || null,
+                password: password || null,
+                ranch_id: parseInt(ranchId),
+                fcm_token: fcmToken
+            })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            currentUser = result.user;
+            // Save user session to localStorage
+            localStorage.setItem('ranchFireAlertUser', JSON.stringify(currentUser));
+            showSuccess('Registration successful! Welcome to the alert system.');
+            showMainApp();
+        } else {
+            throw new Error(result.error || 'Registration failed');
+        }
+        
+    } catch (error) {
+        console.error('Registration error:', error);
+        showError('Registration failed: ' + error.message);
+    } finally {
+        setLoading('registerBtn', false);
+    }
+}
+
+// Main application functions
+function showMainApp() {
+    document.getElementById('userCheckForm').classList.add('hidden');
+    document.getElementById('loginForm').classList.add('hidden');
+    document.getElementById('registrationForm').classList.add('hidden');
+    document.getElementById('mainApp').classList.remove('hidden');
+    
+    // Update user info
+    document.getElementById('userName').textContent = currentUser.name;
+    document.getElementById('userDetails').textContent = `${currentUser.email || currentUser.phone} • ${currentUser.ranch_name || 'Unknown Ranch'}`;
+    
+    // Show user info in connection status pane
+    const userInfoDiv = document.getElementById('userInfo');
+    if (userInfoDiv) {
+        userInfoDiv.style.display = 'block';
+    }
+    
+    updateHomeLocationStatus();
+    
+    // Show admin tabs if user is admin
+    if (currentUser.is_admin) {
+        document.getElementById('adminTabBtn').style.display = 'block';
+        document.getElementById('usersTabBtn').style.display = 'block';
+    }
+    
+    // Load initial data
+    loadAlerts();
+    loadLivestockRequests();
+    
+    // Start live alert updates (falls back to polling if the stream drops)
+    startAlertStream();
+    
+    // Request notification permission if not already granted
+    if ('Notification' in window && Notification.permission === 'default') {
+        console.log('Requesting notification permission on app start...');
+        Notification.requestPermission().then(permission => {
+            console.log('Notification permission result:', permission);
+        });
+    }
+}
+
+// Tab navigation
+function showTab(tabName) {
+    // Hide all tabs
+    document.getElementById('alertsTab').classList.add('hidden');
+    document.getElementById('livestockTab').classList.add('hidden');
+    document.getElementById('adminTab').classList.add('hidden');
+    document.getElementById('usersTab').classList.add('hidden');
+    
+    // Remove active class from all tab buttons
+    document.querySelectorAll('.tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+    
+    // Show selected tab
+    document.getElementById(tabName + 'Tab').classList.remove('hidden');
+    
+    // Add active class to clicked tab
+    event.target.classList.add('active');
+    
+    // Load appropriate data for each tab
+    if (tabName === 'alerts') {
+        loadAlerts();
+    } else if (tabName === 'livestock') {
+        loadLivestockRequests();
+        loadHelperCapacity();
+    } else if (tabName === 'admin') {
+        loadAdminStats();
+    } else if (tabName === 'users') {
+        loadUsers();
+    }
+}
+
+// Alerts functions
+async function loadAlerts() {
+    try {
+        const url = currentUser ? `/api/alerts?user_id=${currentUser.id}` : '/api/alerts';
+        const response = await fetch(url);
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            currentAlerts = result.alerts;
+            alertSyncCursor = result.cursor || null;
+            alertCounts = result.counts || null;
+            alertsNextCursor = result.next_cursor || null;
+            displayAlerts(currentAlerts);
+            updateAlertStats(currentAlerts);
+            
+            // Set the baseline alert count for notifications
+            lastAlertCount = alertCounts ? alertCounts.active :
+                result.alerts.filter(alert => alert.status === 'active').length;
+            console.log(`Initial alert count set to: ${lastAlertCount}`);
+        } else {
+            throw new Error(result.error || 'Failed to load alerts');
+        }
+    } catch (error) {
+        console.error('Error loading alerts:', error);
+        showError('Failed to load alerts: ' + error.message);
+    }
+}
+
+async function loadMoreAlerts(cursor) {
+    try {
+        const base = currentUser ? `/api/alerts?user_id=${currentUser.id}&` : '/api/alerts?';
+        const response = await fetch(`${base}cursor=${encodeURIComponent(cursor)}`);
+        const result = await response.json();
+        
+        if (result.success) {
+            const loadedIds = new Set(currentAlerts.map(alert => alert.id));
+            currentAlerts = currentAlerts.concat(result.alerts.filter(alert => !loadedIds.has(alert.id)));
+            alertsNextCursor = result.next_cursor || null;
+            displayAlerts(currentAlerts);
+        }
+    } catch (error) {
+        console.error('Error loading more alerts:', error);
+    }
+}
+
+// Infinite scroll: call loadMore(cursor) once the end of a list scrolls into view
+const listPagers = {};
+function attachLoadMore(listElement, nextCursor, loadMore) {
+    if (listPagers[listElement.id]) {
+        listPagers[listElement.id].disconnect();
+        delete listPagers[listElement.id];
+    }
+    if (!nextCursor) return;
+    
+    const sentinel = document.createElement('div');
+    sentinel.className = 'load-more';
+    sentinel.innerHTML = '<button class="btn btn-secondary">Load more</button>';
+    listElement.appendChild(sentinel);
+    
+    let loading = false;
+    const trigger = () => {
+        if (loading) return;
+        loading = true;
+        if (listPagers[listElement.id]) {
+            listPagers[listElement.id].disconnect();
+            delete listPagers[listElement.id];
+        }
+        sentinel.textContent = 'Loading more...';
+        loadMore(nextCursor);
+    };
+    sentinel.querySelector('button').addEventListener('click', trigger);
+    
+    if ('IntersectionObserver' in window) {
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) trigger();
+        }, { rootMargin: '200px' });
+        observer.observe(sentinel);
+        listPagers[listElement.id] = observer;
+    }
+}
+
+// Test notification function (for debugging)
+function testNotification() {
+    console.log('Testing notification...');
+    const testAlert = {
+        id: 'test',
+        title: 'Test Alert',
+        message: 'This is a test notification to verify the system is working.',
+        severity: 'medium',
+        status: 'active'
+    };
+    showSystemNotification(testAlert);
+}
+
+function displayAlerts(alerts) {
+    const alertsList = document.getElementById('alertsList');
+    
+    if (alerts.length === 0) {
+        alertsList.innerHTML = `
+            <div class="card">
+                <p style="text-align: center; color: #666;">No fire alerts at this time</p>
+            </div>
+        `;
+        return;
+    }
+    
+    alertsList.innerHTML = alerts.map(alert => `
+        <div class="card alert-card ${alert.severity}" data-alert-id="${alert.id}">
+            <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 10px;">
+                <div class="severity-badge severity-${alert.severity}">
+                    ${alert.severity.toUpperCase()}
+                </div>
+                <span class="alert-status status-${alert.status}">
+                    ${alert.status}
+                </span>
+            </div>
+            <h3>${alert.title}</h3>
+            <p style="margin: 10px 0;">${alert.message}</p>
+            <div class="timestamp">
+                ${new Date(alert.created_at).toLocaleString()}
+            </div>
+            ${currentUser && currentUser.is_admin ? `
+                <div class="admin-alert-actions">
+                    <button class="btn btn-secondary" onclick="editAlert(${alert.id})">✏️ Edit</button>
+                    ${alert.status === 'active' ? 
+                        `<button class="btn btn-success" onclick="resolveAlert(${alert.id})">✅ Resolve</button>` :
+                        `<button class="btn btn-secondary" onclick="reopenAlert(${alert.id})">🔄 Re-open</button>`
+                    }
+                    <button class="btn btn-danger" onclick="deleteAlert(${alert.id})">🗑️ Delete</button>
+                </div>
+            ` : ''}
+        </div>
+    `).join('');
+    
+    attachLoadMore(alertsList, alertsNextCursor, loadMoreAlerts);
+}
+
+function updateAlertStats(alerts) {
+    // Server totals cover every page; counting the list only covers what is loaded
+    const totalAlerts = alertCounts ? alertCounts.total : alerts.length;
+    const activeAlerts = alertCounts ? alertCounts.active : alerts.filter(alert => alert.status === 'active').length;
+    const criticalAlerts = alertCounts ? alertCounts.critical : alerts.filter(alert => alert.severity === 'critical').length;
+    
+    document.getElementById('totalAlerts').textContent = totalAlerts;
+    document.getElementById('activeAlerts').textContent = activeAlerts;
+    document.getElementById('criticalAlerts').textContent = criticalAlerts;
+    
+    // Update tab badges
+    updateTabBadges(alerts);
+}
+
+function updateTabBadges(alerts) {
+    // Update alerts tab badge
+    const alertsTab = document.querySelector('.tab[onclick="showTab(\'alerts\')"]');
+    const activeAlerts = alertCounts ? alertCounts.active : alerts.filter(alert => alert.status === 'active').length;
+    
+    if (alertsTab) {
+        // Remove existing badge
+        const existingBadge = alertsTab.querySelector('.tab-badge');
+        if (existingBadge) {
+            existingBadge.remove();
+        }
+        
+        // Add new badge if there are active alerts
+        if (activeAlerts > 0) {
+            const badge = document.createElement('span');
+            badge.className = 'tab-badge';
+            badge.textContent = activeAlerts;
+            alertsTab.appendChild(badge);
+        }
+    }
+    
+    // Update document title and favicon badge
+    updateDocumentBadge(activeAlerts);
+}
+
+function updateDocumentBadge(alertCount) {
+    // Update document title
+    if (alertCount > 0) {
+        document.title = `(${alertCount}) 🔥 DMR Fire Alert`;
+    } else {
+        document.title = '🔥 DMR Fire Alert';
+    }
+    
+    // Update favicon badge (if supported)
+    if ('setAppBadge' in navigator) {
+        navigator.setAppBadge(alertCount).catch(error => {
+            console.log('App badge not supported:', error);
+        });
+    }
+    
+    // Update service worker badge if available
+    if (swRegistration && swRegistration.active) {
+        swRegistration.active.postMessage({
+            type: 'UPDATE_BADGE',
+            count: alertCount
+        });
+    }
+}
+
+// Livestock functions
+let livestockRequests = [];
+let livestockNextCursor = null;
+
+async function loadLivestockRequests() {
+    try {
+        const url = currentUser ? `/api/livestock-requests?user_id=${currentUser.id}` : '/api/livestock-requests';
+        const response = await fetch(url);
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            livestockRequests = result.requests;
+            livestockNextCursor = result.next_cursor || null;
+            displayLivestockRequests(livestockRequests);
+        } else {
+            throw new Error(result.error || 'Failed to load livestock requests');
+        }
+    } catch (error) {
+        console.error('Error loading livestock requests:', error);
+        showError('Failed to load livestock requests: ' + error.message);
+    }
+}
+
+async function loadMoreLivestockRequests(cursor) {
+    try {
+        const base = currentUser ? `/api/livestock-requests?user_id=${currentUser.id}&` : '/api/livestock-requests?';
+        const response = await fetch(`${base}cursor=${encodeURIComponent(cursor)}`);
+        const result = await response.json();
+        
+        if (result.success) {
+            livestockRequests = livestockRequests.concat(result.requests);
+            livestockNextCursor = result.next_cursor || null;
+            displayLivestockRequests(livestockRequests);
+        }
+    } catch (error) {
+        console.error('Error loading more livestock requests:', error);
+    }
+}
+
+function displayLivestockRequests(requests) {
+    const requestsList = document.getElementById('livestockRequestsList');
+    
+    if (requests.length === 0) {
+        requestsList.innerHTML = `
+            <div class="card">
+                <p style="text-align: center; color: #666;">No livestock help requests</p>
+            </div>
+        `;
+        return;
+    }
+    
+    requestsList.innerHTML = requests.map(request => `
+        <div class="livestock-request">
+            <h4>${request.user_name} - ${request.animal_type} (${request.animal_count})</h4>
+            <p><strong>Urgency:</strong> ${request.urgency_level.toUpperCase()}</p>
+            <p>${request.details}</p>
+            <div class="timestamp">
+                Requested: ${new Date(request.created_at).toLocaleString()}
+            </div>
+            ${helpOffersSummary(request)}
+            ${request.user_id !== currentUser?.id ? `
+                <button class="btn btn-success" onclick="offerHelp(${request.id})">
+                    Offer Help
+                </button>
+            ` : ''}
+            ${request.status === 'open' && (request.user_id === currentUser?.id || currentUser?.is_admin) ? `
+                <button class="btn btn-secondary" onclick="findHelpers(${request.id})">
+                    Find Helpers
+                </button>
+            ` : ''}
+            <div id="helperMatches-${request.id}"></div>
+        </div>
+    `).join('');
+    
+    attachLoadMore(requestsList, livestockNextCursor, loadMoreLivestockRequests);
+}
+
+function helpOffersSummary(request) {
+    const count = request.offer_count || 0;
+    if (count === 0) {
+        return '';
+    }
+    const names = (request.latest_helpers || []).map(helper => helper.name);
+    const more = count > names.length ? ` and ${count - names.length} more` : '';
+    return `<p><strong>🤝 ${count} ${count === 1 ? 'offer' : 'offers'}:</strong> ${names.join(', ')}${more}</p>`;
+}
+
+// Helper capacity: trailer space per animal type and pasture space, matched against open requests
+const HELPER_ANIMAL_TYPES = ['cattle', 'horses', 'sheep', 'goats', 'pigs', 'other'];
+
+function renderHelperCapacity(capacity) {
+    const slots = capacity ? capacity.trailer_slots : {};
+    document.getElementById('trailerSlotInputs').innerHTML = HELPER_ANIMAL_TYPES.map(animalType => `
+        <label style="font-size: 13px;">
+            ${animalType.charAt(0).toUpperCase() + animalType.slice(1)}
+            <input type="number" min="0" id="trailerSlots-${animalType}" value="${slots[animalType] || ''}" placeholder="0">
+        </label>
+    `).join('');
+    document.getElementById('pastureHeadCount').value = capacity ? capacity.pasture_head_count : '';
+    document.getElementById('helperCapacityStatus').textContent = capacity
+        ? `Offered at ${capacity.latitude.toFixed(4)}, ${capacity.longitude.toFixed(4)}. Requesters nearby can find you.`
+        : 'Not offered: let neighbours with livestock requests find you.';
+    document.getElementById('withdrawHelperCapacityBtn').style.display = capacity ? 'inline-block' : 'none';
+}
+
+async function loadHelperCapacity() {
+    try {
+        const response = await fetch(`/api/users/${currentUser.id}/helper-capacity?user_id=${currentUser.id}`);
+        const result = await response.json();
+        if (result.success) {
+            renderHelperCapacity(result.capacity);
+        }
+    } catch (error) {
+        console.error('Error loading helper capacity:', error);
+    }
+}
+
+async function saveHelperCapacity() {
+    try {
+        const coords = await getCurrentPosition();
+        const trailerSlots = {};
+        HELPER_ANIMAL_TYPES.forEach(animalType => {
+            trailerSlots[animalType] = parseInt(document.getElementById(`trailerSlots-${animalType}`).value) || 0;
+        });
+        const response = await fetch(`/api/users/${currentUser.id}/helper-capacity?user_id=${currentUser.id}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                latitude: coords.latitude,
+                longitude: coords.longitude,
+                pasture_head_count: parseInt(document.getElementById('pastureHeadCount').value) || 0,
+                trailer_slots: trailerSlots
+            })
+        });
+        const result = await response.json();
+        if (!result.success) {
+            throw new Error(result.error || 'Failed to save capacity');
+        }
+        renderHelperCapacity(result.capacity);
+        showSuccess('Helper capacity saved');
+    } catch (error) {
+        showError('Could not save capacity: ' + error.message);
+    }
+}
+
+async function withdrawHelperCapacity() {
+    try {
+        const response = await fetch(`/api/users/${currentUser.id}/helper-capacity?user_id=${currentUser.id}`, { method: 'DELETE' });
+        const result = await response.json();
+        if (!result.success) {
+            throw new Error(result.error || 'Failed to withdraw capacity');
+        }
+        renderHelperCapacity(null);
+        showSuccess('Helper capacity withdrawn');
+    } catch (error) {
+        showError('Could not withdraw capacity: ' + error.message);
+    }
+}
+
+async function findHelpers(requestId) {
+    const container = document.getElementById(`helperMatches-${requestId}`);
+    try {
+        const response = await fetch(`/api/livestock-requests/matches?user_id=${currentUser.id}&request_id=${requestId}`);
+        const result = await response.json();
+        if (!result.success) {
+            throw new Error(result.error || 'Failed to find helpers');
+        }
+        const match = result.matches[0];
+        if (!match || match.candidates.length === 0) {
+            container.innerHTML = '<p style="color: #666;">No helpers with space nearby yet.</p>';
+            return;
+        }
+        container.innerHTML = `
+            <ol style="margin: 8px 0 0 20px;">
+                ${match.candidates.map(candidate => `
+                    <li>${candidate.name}${candidate.offered_help ? ' 🤝' : ''}: ${candidate.distance_miles} mi,
+                        room for ${candidate.remaining_capacity}${candidate.suggested_head ? `, suggested ${candidate.suggested_head} head` : ''}</li>
+                `).join('')}
+            </ol>
+            ${match.unmatched_head > 0 ? `<p style="color: #b45309;">${match.unmatched_head} head still need a place.</p>` : ''}
+        `;
+    } catch (error) {
+        console.error('Error finding helpers:', error);
+        showError('Failed to find helpers: ' + error.message);
+    }
+}
+
+async function requestLivestockHelp() {
+    const animalType = document.getElementById('animalType').value;
+    const animalCount = document.getElementById('animalCount').value;
+    const urgencyLevel = document.getElementById('urgencyLevel').value;
+    const details = document.getElementById('helpDetails').value.trim();
+    
+    if (!animalCount || animalCount <= 0) {
+        showError('Please enter a valid number of animals');
+        return;
+    }
+    
+    if (!details) {
+        showError('Please provide details about the help needed');
+        return;
+    }
+    
+    try {
+        const response = await fetch('/api/livestock-requests', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                user_id: currentUser.id,
+                animal_type: animalType,
+                animal_count: parseInt(animalCount),
+                urgency_level: urgencyLevel,
+                details
+            })
+        });
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess('Livestock help request submitted successfully!');
+            
+            // Clear form
+            document.getElementById('animalCount').value = '';
+            document.getElementById('helpDetails').value = '';
+            
+            // Reload requests
+            loadLivestockRequests();
+        } else {
+            throw new Error(result.error || 'Failed to submit request');
+        }
+        
+    } catch (error) {
+        console.error('Error submitting livestock request:', error);
+        showError('Failed to submit request: ' + error.message);
+    }
+}
+
+async function offerHelp(requestId) {
+    try {
+        const response = await fetch(`/api/livestock-requests/${requestId}/help`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ user_id: currentUser.id })
+        });
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess(result.message || 'Help offer sent! The requester will be notified.');
+            
+            // Show the updated offer count without reloading the list
+            const offered = livestockRequests.find(request => request.id === requestId);
+            if (offered) {
+                offered.offer_count = result.offer_count;
+                offered.latest_helpers = result.latest_helpers;
+                displayLivestockRequests(livestockRequests);
+            }
+        } else {
+            throw new Error(result.error || 'Failed to offer help');
+        }
+        
+    } catch (error) {
+        console.error('Error offering help:', error);
+        showError('Failed to offer help: ' + error.message);
+    }
+}
+
+// Admin functions
+async function loadAdminStats() {
+    if (!currentUser || !currentUser.is_admin) return;
+    
+    try {
+        const response = await fetch(`/api/admin/stats?user_id=${currentUser.id}`);
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            const stats = result.stats;
+            document.getElementById('adminStats').innerHTML = `
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 15px;">
+                    <div style="text-align: center;">
+                        <div style="font-size: 24px; font-weight: bold; color: #d32f2f;">${stats.total_users}</div>
+                        <div style="font-size: 12px; color: #666;">Total Users</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 24px; font-weight: bold; color: #d32f2f;">${stats.total_alerts}</div>
+                        <div style="font-size: 12px; color: #666;">Total Alerts</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 20px; font-weight: bold; color: #1976d2;">${stats.active_alerts}</div>
+                        <div style="font-size: 12px; color: #666;">Active Alerts</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 20px; font-weight: bold; color: #388e3c;">${stats.resolved_alerts}</div>
+                        <div style="font-size: 12px; color: #666;">Resolved Alerts</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 24px; font-weight: bold; color: #ff9800;">${stats.livestock_requests}</div>
+                        <div style="font-size: 12px; color: #666;">Help Requests</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 24px; font-weight: bold; color: #4caf50;">${stats.active_ranches}</div>
+                        <div style="font-size: 12px; color: #666;">Active Ranches</div>
+                    </div>
+                </div>
+            `;
+        } else {
+            throw new Error(result.error || 'Failed to load admin stats');
+        }
+    } catch (error) {
+        console.error('Error loading admin stats:', error);
+        document.getElementById('adminStats').innerHTML = '<p style="color: #f44336;">Failed to load statistics</p>';
+    }
+}
+
+async function sendAlert() {
+    if (!currentUser || !currentUser.is_admin) {
+        showError('Admin access required');
+        return;
+    }
+    
+    const title = document.getElementById('alertTitle').value.trim();
+    const message = document.getElementById('alertMessage').value.trim();
+    const severity = document.getElementById('alertSeverity').value;
+    const targetRanch = document.getElementById('targetRanch').value;
+    const latitude = document.getElementById('alertLatitude').value;
+    const longitude = document.getElementById('alertLongitude').value;
+    
+    if (!title || !message) {
+        showError('Please provide both title and message for the alert');
+        return;
+    }
+    if ((latitude === '') !== (longitude === '')) {
+        showError('Provide both latitude and longitude, or neither');
+        return;
+    }
+    
+    try {
+        const response = await fetch('/api/alerts', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                title,
+                message,
+                severity,
+                ranch_id: targetRanch === 'all' ? null : parseInt(targetRanch),
+                latitude: latitude === '' ? null : parseFloat(latitude),
+                longitude: longitude === '' ? null : parseFloat(longitude),
+                user_id: currentUser.id
+            })
+        });
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess('Fire alert sent successfully!');
+            
+            // Clear form
+            document.getElementById('alertTitle').value = '';
+            document.getElementById('alertMessage').value = '';
+            document.getElementById('alertSeverity').value = 'low';
+            document.getElementById('targetRanch').value = 'all';
+            document.getElementById('alertLatitude').value = '';
+            document.getElementById('alertLongitude').value = '';
+            
+            // Refresh alerts
+            loadAlerts();
+        } else {
+            throw new Error(result.error || 'Failed to send alert');
+        }
+        
+    } catch (error) {
+        console.error('Error sending alert:', error);
+        showError('Failed to send alert: ' + error.message);
+    }
+}
+
+function getCurrentPosition() {
+    return new Promise((resolve, reject) => {
+        if (!navigator.geolocation) {
+            reject(new Error('Location is not available in this browser'));
+            return;
+        }
+        navigator.geolocation.getCurrentPosition(
+            position => resolve(position.coords),
+            error => reject(new Error(error.message)),
+            { enableHighAccuracy: true, timeout: 15000 }
+        );
+    });
+}
+
+async function fillAlertLocation() {
+    try {
+        const coords = await getCurrentPosition();
+        document.getElementById('alertLatitude').value = coords.latitude.toFixed(5);
+        document.getElementById('alertLongitude').value = coords.longitude.toFixed(5);
+    } catch (error) {
+        showError('Could not get location: ' + error.message);
+    }
+}
+
+// Home location: alerts with a location only reach users within range of it
+function updateHomeLocationStatus() {
+    const hasLocation = currentUser.home_latitude != null && currentUser.home_longitude != null;
+    document.getElementById('homeLocationStatus').textContent = hasLocation
+        ? `Alerts are sent to you when a fire is near ${currentUser.home_latitude.toFixed(4)}, ${currentUser.home_longitude.toFixed(4)}.`
+        : 'No location set: you receive every alert for your ranch.';
+    document.getElementById('clearHomeLocationBtn').style.display = hasLocation ? 'inline-block' : 'none';
+}
+
+async function putHomeLocation(latitude, longitude) {
+    const response = await fetch(`/api/users/${currentUser.id}/location?user_id=${currentUser.id}`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ latitude, longitude })
+    });
+    const result = await response.json();
+    if (!result.success) {
+        throw new Error(result.error || 'Failed to save location');
+    }
+    currentUser.home_latitude = result.home_latitude;
+    currentUser.home_longitude = result.home_longitude;
+    localStorage.setItem('ranchFireAlertUser', JSON.stringify(currentUser));
+    updateHomeLocationStatus();
+}
+
+async function saveHomeLocation() {
+    try {
+        const coords = await getCurrentPosition();
+        await putHomeLocation(coords.latitude, coords.longitude);
+        showSuccess('Alert location saved');
+    } catch (error) {
+        showError('Could not save location: ' + error.message);
+    }
+}
+
+async function clearHomeLocation() {
+    try {
+        await putHomeLocation(null, null);
+        showSuccess('Alert location cleared');
+    } catch (error) {
+        showError('Could not clear location: ' + error.message);
+    }
+}
+
+async function editAlert(alertId) {
+    // Get current alert data
+    try {
+        const response = await fetch(`/api/alerts/${alertId}`);
+        const result = await response.json();
+        
+        if (!result.success) {
+            throw new Error(result.error || 'Failed to get alert data');
+        }
+        
+        const alert = result.alert;
+        
+        // Create edit form
+        const editForm = `
+            <div class="card" style="margin-top: 15px;">
+                <h4>Edit Alert</h4>
+                <div class="form-group">
+                    <label>Title</label>
+                    <input type="text" id="editTitle" value="${alert.title}" />
+                </div>
+                <div class="form-group">
+                    <label>Message</label>
+                    <textarea id="editMessage" rows="3">${alert.message}</textarea>
+                </div>
+                <div class="form-group">
+                    <label>Severity</label>
+                    <select id="editSeverity">
+                        <option value="low" ${alert.severity === 'low' ? 'selected' : ''}>🟡 Low</option>
+                        <option value="medium" ${alert.severity === 'medium' ? 'selected' : ''}>🟠 Medium</option>
+                        <option value="high" ${alert.severity === 'high' ? 'selected' : ''}>🔴 High</option>
+                        <option value="critical" ${alert.severity === 'critical' ? 'selected' : ''}>⚫ Critical</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label>Status</label>
+                    <select id="editStatus">
+                        <option value="active" ${alert.status === 'active' ? 'selected' : ''}>Active</option>
+                        <option value="resolved" ${alert.status === 'resolved' ? 'selected' : ''}>Resolved</option>
+                    </select>
+                </div>
+                <div style="display: flex; gap: 10px;">
+                    <button class="btn btn-secondary" onclick="saveAlertEdit(${alertId})">Save Changes</button>
+                    <button class="btn" onclick="cancelEdit()">Cancel</button>
+                </div>
+            </div>
+        `;
+        
+        // Show edit form
+        const alertElement = document.querySelector(`[data-alert-id="${alertId}"]`);
+        if (alertElement) {
+            alertElement.insertAdjacentHTML('afterend', editForm);
+        }
+        
+    } catch (error) {
+        console.error('Error loading alert for edit:', error);
+        showError('Failed to load alert data: ' + error.message);
+    }
+}
+
+async function saveAlertEdit(alertId) {
+    const title = document.getElementById('editTitle').value.trim();
+    const message = document.getElementById('editMessage').value.trim();
+    const severity = document.getElementById('editSeverity').value;
+    const status = document.getElementById('editStatus').value;
+    
+    if (!title || !message) {
+        showError('Title and message are required');
+        return;
+    }
+    
+    try {
+        const response = await fetch(`/api/alerts/${alertId}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                title,
+                message,
+                severity,
+                status
+            })
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess('Alert updated successfully!');
+            cancelEdit();
+            loadAlerts();
+            if (currentUser && currentUser.is_admin) {
+                loadAdminAlerts();
+            }
+        } else {
+            throw new Error(result.error || 'Failed to update alert');
+        }
+    } catch (error) {
+        console.error('Error updating alert:', error);
+        showError('Failed to update alert: ' + error.message);
+    }
+}
+
+function cancelEdit() {
+    const editForm = document.querySelector('.card h4');
+    if (editForm && editForm.textContent === 'Edit Alert') {
+        editForm.closest('.card').remove();
+    }
+}
+
+// Admin alert management functions
+let adminAlerts = [];
+let adminAlertsNextCursor = null;
+
+async function loadMoreAdminAlerts(cursor) {
+    try {
+        const response = await fetch(`/api/admin/alerts?user_id=${currentUser.id}&cursor=${encodeURIComponent(cursor)}`);
+        const result = await response.json();
+        
+        if (result.success) {
+            adminAlerts = adminAlerts.concat(result.alerts);
+            adminAlertsNextCursor = result.next_cursor || null;
+            displayAdminAlerts(adminAlerts);
+        }
+    } catch (error) {
+        console.error('Error loading more admin alerts:', error);
+    }
+}
+
+async function loadAdminAlerts() {
+    if (!currentUser || !currentUser.is_admin) return;
+    
+    try {
+        const response = await fetch(`/api/admin/alerts?user_id=${currentUser.id}`);
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            adminAlerts = result.alerts;
+            adminAlertsNextCursor = result.next_cursor || null;
+            displayAdminAlerts(adminAlerts);
+        } else {
+            throw new Error(result.error || 'Failed to load admin alerts');
+        }
+    } catch (error) {
+        console.error('Error loading admin alerts:', error);
+        document.getElementById('adminAlertsList').innerHTML = 
+            '<p style="color: #f44336;">Failed to load alerts: ' + error.message + '</p>';
+    }
+}
+
+function displayAdminAlerts(alerts) {
+    const alertsList = document.getElementById('adminAlertsList');
+    
+    if (alerts.length === 0) {
+        alertsList.innerHTML = '<p style="text-align: center; color: #666;">No alerts found</p>';
+        return;
+    }
+    
+    const tableHTML = `
+        <table class="alert-table">
+            <thead>
+                <tr>
+                    <th>Title</th>
+                    <th>Severity</th>
+                    <th>Status</th>
+                    <th>Creator</th>
+                    <th>Ranch</th>
+                    <th>Created</th>
+                    <th>Actions</th>
+                </tr>
+            </thead>
+            <tbody>
+                ${alerts.map(alert => `
+                    <tr data-alert-id="${alert.id}">
+                        <td>
+                            <div class="alert-details" title="${alert.title}">
+                                <strong>${alert.title}</strong>
+                            </div>
+                        </td>
+                        <td>
+                            <span class="severity-badge severity-${alert.severity}">
+                                ${alert.severity.toUpperCase()}
+                            </span>
+                        </td>
+                        <td>
+                            <span class="alert-status status-${alert.status}">
+                                ${alert.status}
+                            </span>
+                        </td>
+                        <td>${alert.creator_name}</td>
+                        <td>${alert.ranch_name}${alert.shared_with && alert.shared_with.length ? `<br><small>+ ${alert.shared_with.join(', ')}</small>` : ''}</td>
+                        <td>${new Date(alert.created_at).toLocaleDateString()}</td>
+                        <td>
+                            <div class="alert-actions">
+                                <button class="btn btn-secondary" onclick="editAlert(${alert.id})" title="Edit Alert">
+                                    ✏️ Edit
+                                </button>
+                                ${alert.status === 'active' ? 
+                                    `<button class="btn btn-success" onclick="resolveAlert(${alert.id})" title="Resolve Alert">
+                                        ✅ Resolve
+                                    </button>` :
+                                    `<button class="btn btn-secondary" onclick="reopenAlert(${alert.id})" title="Re-open Alert">
+                                        🔄 Re-open
+                                    </button>`
+                                }
+                                <button class="btn btn-danger" onclick="deleteAlert(${alert.id})" title="Delete Alert">
+                                    🗑️ Delete
+                                </button>
+                            </div>
+                        </td>
+                    </tr>
+                `).join('')}
+            </tbody>
+        </table>
+    `;
+    
+    alertsList.innerHTML = tableHTML;
+    filterAdminAlerts();
+    attachLoadMore(alertsList, adminAlertsNextCursor, loadMoreAdminAlerts);
+}
+
+function filterAdminAlerts() {
+    const filter = document.getElementById('alertFilter').value;
+    const rows = document.querySelectorAll('#adminAlertsList .alert-table tbody tr');
+    
+    rows.forEach(row => {
+        const statusCell = row.querySelector('.alert-status');
+        const status = statusCell ? statusCell.textContent.trim() : '';
+        
+        if (filter === 'all' || status === filter) {
+            row.style.display = '';
+        } else {
+            row.style.display = 'none';
+        }
+    });
+}
+
+async function resolveAlert(alertId) {
+    if (!confirm('Are you sure you want to resolve this alert?')) return;
+    
+    try {
+        const response = await fetch(`/api/admin/alerts/${alertId}/resolve?user_id=${currentUser.id}`, {
+            method: 'POST'
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess('Alert resolved successfully!');
+            loadAdminAlerts();
+            loadAlerts(); // Refresh regular alerts view too
+        } else {
+            throw new Error(result.error || 'Failed to resolve alert');
+        }
+    } catch (error) {
+        console.error('Error resolving alert:', error);
+        showError('Failed to resolve alert: ' + error.message);
+    }
+}
+
+async function reopenAlert(alertId) {
+    if (!confirm('Are you sure you want to re-open this alert?')) return;
+    
+    try {
+        const response = await fetch(`/api/admin/alerts/${alertId}/reopen?user_id=${currentUser.id}`, {
+            method: 'POST'
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess('Alert reopened successfully!');
+            loadAdminAlerts();
+            loadAlerts(); // Refresh regular alerts view too
+        } else {
+            throw new Error(result.error || 'Failed to reopen alert');
+        }
+    } catch (error) {
+        console.error('Error reopening alert:', error);
+        showError('Failed to reopen alert: ' + error.message);
+    }
+}
+
+async function deleteAlert(alertId) {
+    if (!confirm('Are you sure you want to delete this alert?')) return;
+    
+    try {
+        const response = await fetch(`/api/alerts/${alertId}`, {
+            method: 'DELETE'
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess('Alert deleted successfully!');
+            loadAlerts();
+            if (currentUser && currentUser.is_admin) {
+                loadAdminAlerts();
+            }
+        } else {
+            throw new Error(result.error || 'Failed to delete alert');
+        }
+    } catch (error) {
+        console.error('Error deleting alert:', error);
+        showError('Failed to delete alert: ' + error.message);
+    }
+}
+
+function logout() {
+    stopAlertStream();
+    currentAlerts = [];
+    alertSyncCursor = null;
+    alertCounts = null;
+    alertsNextCursor = null;
+    currentUser = null;
+    // Clear session from localStorage
+    localStorage.removeItem('ranchFireAlertUser');
+    
+    // Clear PWA install dismissed preference so user sees prompt again on next login
+    localStorage.removeItem('pwaInstallDismissed');
+    
+    // Hide user info in connection status pane
+    const userInfoDiv = document.getElementById('userInfo');
+    if (userInfoDiv) {
+        userInfoDiv.style.display = 'none';
+    }
+    
+    showSuccess('Logged out successfully');
+    setTimeout(() => {
+        showUserCheck();
+    }, 1000);
+}
+
+// Handle online/offline events
+window.addEventListener('online', () => {
+    checkConnection();
+    showSuccess('Connection restored');
+});
+
+window.addEventListener('offline', () => {
+    checkConnection();
+    showError('Connection lost - app will work offline');
+});
+
+// Handle Enter key on forms
+document.addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        const activeForm = document.querySelector('.card:not(.hidden)');
+        if (activeForm) {
+            const button = activeForm.querySelector('.btn:not(.hidden)');
+            if (button && !button.disabled) {
+                button.click();
+            }
+        }
+    }
+});
+
+// Session validation
+async function validateSession() {
+    if (!currentUser || !currentUser.id) {
+        localStorage.removeItem('ranchFireAlertUser');
+        showUserCheck();
+        return;
+    }
+    
+    try {
+        // Try to load alerts to validate session
+        const response = await fetch(`/api/alerts?user_id=${currentUser.id}&limit=1`);
+        
+        if (response.ok) {
+            // Session is valid, show main app
+            showMainApp();
+        } else {
+            // Session is invalid, clear and show login
+            localStorage.removeItem('ranchFireAlertUser');
+            currentUser = null;
+            showUserCheck();
+        }
+    } catch (error) {
+        console.error('Session validation error:', error);
+        // On network error, still show main app (offline mode)
+        showMainApp();
+    }
+}
+
+// Database management functions
+async function loadDatabaseStatus() {
+    if (!currentUser || !currentUser.is_admin) return;
+    
+    try {
+        const response = await fetch(`/api/admin/database/status?user_id=${currentUser.id}`);
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            displayDatabaseStatus(result.database);
+            return result.database;
+        } else {
+            throw new Error(result.error || 'Failed to load database status');
+        }
+    } catch (error) {
+        console.error('Error loading database status:', error);
+        document.getElementById('databaseStatus').innerHTML = 
+            '<p style="color: #f44336;">Failed to load database status: ' + error.message + '</p>';
+    }
+}
+
+function displayDatabaseStatus(dbInfo) {
+    const statusDiv = document.getElementById('databaseStatus');
+    
+    let backupsHtml = '';
+    if (dbInfo.backups && dbInfo.backups.length > 0) {
+        backupsHtml = `
+            <h4>Backups (${dbInfo.backups.length})</h4>
+            <div style="max-height: 200px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; margin: 10px 0;">
+                ${dbInfo.backups.map(backup => `
+                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 5px 0; border-bottom: 1px solid #eee;">
+                        <div>
+                            <strong>${backup.filename}</strong><br>
+                            <small>Size: ${(backup.size / 1024).toFixed(1)} KB${backup.raw_size ? ` (${(backup.raw_size / 1024).toFixed(1)} KB uncompressed)` : ''}</small><br>
+                            <small>${backup.sha256 ? `SHA-256 ${backup.sha256.slice(0, 12)}…` : 'No checksum'} · ${backup.verified ? '✓ Verified' : '⚠ Unverified'}</small>
+                        </div>
+                        <div style="text-align: right;">
+                            <small>${new Date(backup.modified).toLocaleString()}</small>
+                        </div>
+                    </div>
+                `).join('')}
+            </div>
+        `;
+    }
+    
+    const job = dbInfo.backup_job || {};
+    let backupJobHtml = '';
+    if (job.running) {
+        backupJobHtml = '<p><strong>Backup:</strong> in progress…</p>';
+    } else if (job.last_error) {
+        backupJobHtml = `<p style="color: #f44336;"><strong>Last backup failed:</strong> ${job.last_error}</p>`;
+    }
+    if (job.next_run_at) {
+        backupJobHtml += `<p><strong>Next scheduled backup:</strong> ${new Date(job.next_run_at + 'Z').toLocaleString()}</p>`;
+    }
+    
+    statusDiv.innerHTML = `
+        <div style="margin-bottom: 15px;">
+            <h4>Database Information</h4>
+            ${backupJobHtml}
+            <p><strong>Type:</strong> ${dbInfo.type}</p>
+            <p><strong>Connection:</strong> ${dbInfo.uri}</p>
+            <p><strong>Tables:</strong> ${dbInfo.tables.length} tables</p>
+            <ul style="margin: 5px 0; padding-left: 20px;">
+                ${dbInfo.tables.map(table => `<li>${table}</li>`).join('')}
+            </ul>
+        </div>
+        ${backupsHtml}
+    `;
+}
+
+// Backups run in the background; refresh the status until the job finishes
+async function waitForBackup(attempt = 0) {
+    const dbInfo = await loadDatabaseStatus();
+    if (dbInfo && dbInfo.backup_job && dbInfo.backup_job.running && attempt < 60) {
+        setTimeout(() => waitForBackup(attempt + 1), 1000);
+    }
+}
+
+async function createDatabaseBackup() {
+    if (!currentUser || !currentUser.is_admin) return;
+    
+    if (!confirm('Create a database backup? This may take a moment.')) return;
+    
+    try {
+        const response = await fetch(`/api/admin/database/backup?user_id=${currentUser.id}`, {
+            method: 'POST'
+        });
+        
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showSuccess(result.message || 'Database backup started');
+            waitForBackup();
+        } else {
+            throw new Error(result.error || 'Failed to create backup');
+        }
+    } catch (error) {
+        console.error('Error creating database backup:', error);
+        showError('Failed to create backup: ' + error.message);
+    }
+}
+
+function exportHistory(kind) {
+    if (!currentUser || !currentUser.is_admin) return;
+    
+    const from = document.getElementById('exportFrom').value;
+    const to = document.getElementById('exportTo').value;
+    if (from && to && from > to) {
+        showError('The start date must be on or before the end date');
+        return;
+    }
+    
+    const params = new URLSearchParams({
+        user_id: currentUser.id,
+        format: document.getElementById('exportFormat').value
+    });
+    if (from) params.set('from', from);
+    if (to) params.set('to', to);
+    const ranchId = document.getElementById('exportRanch').value;
+    if (ranchId) params.set('ranch_id', ranchId);
+    
+    // A plain download link lets the browser stream the file to disk instead of holding it in memory
+    const link = document.createElement('a');
+    link.href = `/api/admin/export/${kind}?${params}`;
+    link.download = '';
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+}
+
+// --- User Management Functions ---
+let adminUsers = [];
+let adminUsersNextCursor = null;
+
+async function loadUsers() {
+    const usersList = document.getElementById('usersList');
+    usersList.innerHTML = '<p>Loading users...</p>';
+    try {
+        const response = await fetch(`/api/admin/users?user_id=${currentUser.id}`);
+        const result = await response.json();
+        if (result.success) {
+            adminUsers = result.users;
+            adminUsersNextCursor = result.next_cursor || null;
+            displayUsers(adminUsers);
+        } else {
+            usersList.innerHTML = `<p style='color:#B22222;'>${result.error || 'Failed to load users.'}</p>`;
+        }
+    } catch (error) {
+        usersList.innerHTML = `<p style='color:#B22222;'>Error loading users: ${error.message}</p>`;
+    }
+}
+
+async function loadMoreUsers(cursor) {
+    try {
+        const response = await fetch(`/api/admin/users?user_id=${currentUser.id}&cursor=${encodeURIComponent(cursor)}`);
+        const result = await response.json();
+        if (result.success) {
+            adminUsers = adminUsers.concat(result.users);
+            adminUsersNextCursor = result.next_cursor || null;
+            displayUsers(adminUsers);
+        }
+    } catch (error) {
+        console.error('Error loading more users:', error);
+    }
+}
+
+function displayUsers(users) {
+    const usersList = document.getElementById('usersList');
+    if (users.length === 0) {
+        usersList.innerHTML = '<p>No users found.</p>';
+        return;
+    }
+    let table = `<table class="alert-table"><thead><tr><th>Name</th><th>Email</th><th>Phone</th><th>Ranch</th><th>Admin</th><th>Actions</th></tr></thead><tbody>`;
+    for (const user of users) {
+        table += `<tr>
+            <td>${user.name}</td>
+            <td>${user.email || ''}</td>
+            <td>${user.phone || ''}</td>
+            <td>${user.ranch_id || ''}</td>
+            <td>${user.is_admin ? 'Yes' : 'No'}</td>
+            <td>
+                <button class='btn btn-secondary' onclick='showEditUserModal(${user.id})'>Edit</button>
+                <button class='btn btn-danger' onclick='deleteUser(${user.id})'>Delete</button>
+            </td>
+        </tr>`;
+    }
+    table += '</tbody></table>';
+    usersList.innerHTML = table;
+    attachLoadMore(usersList, adminUsersNextCursor, loadMoreUsers);
+}
+
+// --- User Management Modal Logic ---
+let editingUserId = null;
+function showAddUserModal() {
+    editingUserId = null;
+    document.getElementById('userModalTitle').textContent = 'Add User';
+    document.getElementById('userFormName').value = '';
+    document.getElementById('userEmail').value = '';
+    document.getElementById('userPhone').value = '';
+    document.getElementById('userPassword').value = '';
+    document.getElementById('userIsAdmin').checked = false;
+    loadRanchOptions('userRanch');
+    document.getElementById('userModal').classList.remove('hidden');
+}
+async function showEditUserModal(userId) {
+    editingUserId = userId;
+    document.getElementById('userModalTitle').textContent = 'Edit User';
+    document.getElementById('userPassword').value = '';
+    loadRanchOptions('userRanch');
+    try {
+        const response = await fetch(`/api/admin/users/${userId}?user_id=${currentUser.id}`);
+        const result = await response.json();
+        if (result.success) {
+            const user = result.user;
+            document.getElementById('userFormName').value = user.name || '';
+            document.getElementById('userEmail').value = user.email || '';
+            document.getElementById('userPhone').value = user.phone || '';
+            document.getElementById('userIsAdmin').checked = !!user.is_admin;
+            document.getElementById('userRanch').value = user.ranch_id || '';
+            document.getElementById('userModal').classList.remove('hidden');
+        }
+    } catch {}
+}
+function closeUserModal() {
+    document.getElementById('userModal').classList.add('hidden');
+}
+async function saveUser() {
+    const name = document.getElementById('userFormName').value.trim();
+    const email = document.getElementById('userEmail').value.trim();
+    const phone = document.getElementById('userPhone').value.trim();
+    const password = document.getElementById('userPassword').value;
+    const ranch_id = document.getElementById('userRanch').value;
+    const is_admin = document.getElementById('userIsAdmin').checked;
+    
+    // Debug logging
+    console.log('Form values:');
+    console.log('  name:', `"${name}"`, 'length:', name.length);
+    console.log('  email:', `"${email}"`);
+    console.log('  phone:', `"${phone}"`);
+    console.log('  ranch_id:', `"${ranch_id}"`);
+    console.log('  is_admin:', is_admin);
+    
+    // Better validation
+    if (!name) {
+        console.log('Validation failed: name is empty');
+        alert('Name is required.');
+        return;
+    }
+    if (!ranch_id || ranch_id === '') {
+        console.log('Validation failed: ranch_id is empty');
+        alert('Ranch selection is required.');
+        return;
+    }
+    if (!email && !phone) {
+        console.log('Validation failed: neither email nor phone provided');
+        alert('Email or phone number is required.');
+        return;
+    }
+    
+    console.log('Validation passed, sending request...');
+    
+    const payload = { name, email, phone, password, ranch_id, is_admin };
+    let url = '/api/admin/users', method = 'POST';
+    if (editingUserId) {
+        url = `/api/admin/users/${editingUserId}`;
+        method = 'PUT';
+    }
+    try {
+        const response = await fetch(url + `?user_id=${currentUser.id}`, {
+            method,
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload)
+        });
+        const result = await response.json();
+        if (result.success) {
+            closeUserModal();
+            loadUsers();
+        } else {
+            alert(result.error || 'Failed to save user.');
+        }
+    } catch (error) {
+        alert('Error saving user: ' + error.message);
+    }
+}
+async function deleteUser(userId) {
+    if (!confirm('Delete this user?')) return;
+    try {
+        const response = await fetch(`/api/admin/users/${userId}?user_id=${currentUser.id}`, { method: 'DELETE' });
+        const result = await response.json();
+        if (result.success) {
+            loadUsers();
+        } else {
+            alert(result.error || 'Failed to delete user.');
+        }
+    } catch (error) {
+        alert('Error deleting user: ' + error.message);
+    }
+}
+async function loadRanchOptions(selectId) {
+    const select = document.getElementById(selectId);
+    select.innerHTML = '<option value="">Loading...</option>';
+    try {
+        const response = await fetch('/api/ranches');
+        const result = await response.json();
+        if (result.success) {
+            select.innerHTML = '<option value="">Select Ranch</option>';
+            for (const ranch of result.ranches) {
+                select.innerHTML += `<option value="${ranch.id}">${ranch.name}</option>`;
+            }
+        } else {
+            select.innerHTML = '<option value="">Failed to load ranches</option>';
+        }
+    } catch {
+        select.innerHTML = '<option value="">Failed to load ranches</option>';
+    }
+}
+
+window.showEditUserModal = showEditUserModal;
+window.showAddUserModal = showAddUserModal;
+window.deleteUser = deleteUser;
+window.closeUserModal = closeUserModal;
+
+// --- iOS/Safari Install Banner Logic ---
+function isIos() {
+    return /iphone|ipad|ipod/i.test(navigator.userAgent);
+}
+function isInStandaloneMode() {
+    return (window.navigator.standalone === true) || (window.matchMedia && window.matchMedia('(display-mode: standalone)').matches);
+}
+function isSafari() {
+    return /^((?!chrome|android).)*safari/i.test(navigator.userAgent);
+}
+function maybeShowIosInstallBanner() {
+    if (isIos() && isSafari() && !isInStandaloneMode()) {
+        if (!localStorage.getItem('iosInstallBannerDismissed')) {
+            document.getElementById('iosInstallBanner').classList.remove('hidden');
+        }
+    }
+}
+function dismissIosBanner() {
+    document.getElementById('iosInstallBanner').classList.add('hidden');
+    localStorage.setItem('iosInstallBannerDismissed', '1');
+}
+document.addEventListener('DOMContentLoaded', maybeShowIosInstallBanner);
+
+// Live alert stream (Server-Sent Events) with polling fallback
+let currentAlerts = [];
+let alertSyncCursor = null;
+let alertCounts = null;
+let alertsNextCursor = null;
+let alertStream = null;
+let alertPollTimer = null;
+let alertStreamDropped = false;
+const ALERT_POLL_INTERVAL = 30000;
+const ALERT_EVENT_TYPES = ['created', 'updated', 'resolved', 'reopened', 'deleted'];
+
+function startAlertStream() {
+    stopAlertStream();
+    if (!currentUser) return;
+    
+    if (!('EventSource' in window)) {
+        console.log('EventSource not supported, polling for alerts');
+        startAlertPolling();
+        return;
+    }
+    
+    alertStream = new EventSource(`/api/alerts/stream?user_id=${currentUser.id}`);
+    
+    alertStream.onopen = () => {
+        console.log('Alert stream connected');
+        stopAlertPolling();
+        if (alertStreamDropped) {
+            // Catch up on anything missed while disconnected
+            alertStreamDropped = false;
+            checkForNewAlerts();
+        }
+    };
+    
+    alertStream.onerror = () => {
+        // EventSource reconnects on its own; poll until it does
+        console.log('Alert stream dropped, falling back to polling');
+        alertStreamDropped = true;
+        startAlertPolling();
+    };
+    
+    ALERT_EVENT_TYPES.forEach(type => {
+        alertStream.addEventListener(type, (event) => {
+            const payload = JSON.parse(event.data);
+            if (payload.counts) alertCounts = payload.counts;
+            handleAlertEvent(type, payload.alert);
+        });
+    });
+    alertStream.addEventListener('resync', () => loadAlerts());
+}
+
+function stopAlertStream() {
+    if (alertStream) {
+        alertStream.close();
+        alertStream = null;
+    }
+    alertStreamDropped = false;
+    stopAlertPolling();
+}
+
+function startAlertPolling() {
+    if (alertPollTimer) return;
+    alertPollTimer = setInterval(checkForNewAlerts, ALERT_POLL_INTERVAL);
+}
+
+function stopAlertPolling() {
+    if (alertPollTimer) {
+        clearInterval(alertPollTimer);
+        alertPollTimer = null;
+    }
+}
+
+function handleAlertEvent(type, alert) {
+    console.log(`Alert stream event: ${type}`, alert);
+    
+    const newAlerts = type === 'deleted' ?
+        mergeAlertChanges([], [alert.id]) :
+        mergeAlertChanges([alert], []);
+    
+    if (type === 'created' && newAlerts.length > 0 && !document.hasFocus()) {
+        showSystemNotification(alert);
+    }
+}
+
+// Apply changed and deleted alerts to the local list; returns alerts that are newly active
+function mergeAlertChanges(changedAlerts, deletedIds) {
+    const newAlerts = [];
+    
+    if (deletedIds.length > 0) {
+        currentAlerts = currentAlerts.filter(existing => !deletedIds.includes(existing.id));
+    }
+    
+    const oldestLoaded = currentAlerts.length > 0 ? currentAlerts[currentAlerts.length - 1] : null;
+    changedAlerts.forEach(alert => {
+        const index = currentAlerts.findIndex(existing => existing.id === alert.id);
+        if (index !== -1) {
+            currentAlerts[index] = alert;
+        } else if (!alertsNextCursor || !oldestLoaded || new Date(alert.created_at) >= new Date(oldestLoaded.created_at)) {
+            // Alerts older than the loaded pages arrive with the next page instead
+            currentAlerts.push(alert);
+            if (alert.status === 'active') newAlerts.push(alert);
+        }
+    });
+    
+    if (changedAlerts.length === 0 && deletedIds.length === 0) {
+        return newAlerts;
+    }
+    
+    currentAlerts.sort((a, b) => new Date(b.created_at) - new Date(a.created_at) || b.id - a.id);
+    displayAlerts(currentAlerts);
+    updateAlertStats(currentAlerts);
+    lastAlertCount = alertCounts ? alertCounts.active :
+        currentAlerts.filter(existing => existing.status === 'active').length;
+    return newAlerts;
+}
+
+// Poll for new alerts (used only while the alert stream is down)
+let lastAlertCount = 0;
+async function checkForNewAlerts() {
+    if (!currentUser) {
+        console.log('No current user, skipping alert check');
+        return;
+    }
+    
+    if (!alertSyncCursor) {
+        // No baseline yet; a full load sets one
+        await loadAlerts();
+        return;
+    }
+    
+    console.log('Checking for new alerts...');
+    
+    try {
+        let hasMore = true;
+        while (hasMore) {
+            const response = await fetch(`/api/alerts?user_id=${currentUser.id}&since=${encodeURIComponent(alertSyncCursor)}`);
+            
+            if (response.status === 400) {
+                // Cursor rejected by the server; start over from a full load
+                alertSyncCursor = null;
+                await loadAlerts();
+                return;
+            }
+            
+            const result = await response.json();
+            if (!result.success) break;
+            
+            const deletedIds = (result.deleted || []).map(tombstone => tombstone.id);
+            const newAlerts = mergeAlertChanges(result.alerts, deletedIds);
+            
+            // If we have new alerts and the app is not focused, show notification
+            if (newAlerts.length > 0 && !document.hasFocus()) {
+                console.log(`New alerts detected! Showing ${newAlerts.length} notifications`);
+                newAlerts.forEach(alert => {
+                    showSystemNotification(alert);
+                });
+            }
+            
+            alertSyncCursor = result.cursor;
+            hasMore = result.has_more;
+            if (result.counts) {
+                alertCounts = result.counts;
+                updateAlertStats(currentAlerts);
+            }
+        }
+        
+        console.log(`Current alerts: ${lastAlertCount} active`);
+    } catch (error) {
+        console.error('Error checking for new alerts:', error);
+    }
+}
+
+// Show system notification
+function showSystemNotification(alert) {
+    console.log('Attempting to show system notification for alert:', alert);
+    
+    if (!('Notification' in window)) {
+        console.log('Notifications not supported in this browser');
+        return;
+    }
+    
+    console.log('Notification permission:', Notification.permission);
+    
+    if (Notification.permission === 'default') {
+        console.log('Requesting notification permission...');
+        Notification.requestPermission().then(permission => {
+            console.log('Permission granted:', permission);
+            if (permission === 'granted') {
+                createNotification(alert);
+            }
+        });
+        return;
+    }
+    
+    if (Notification.permission !== 'granted') {
+        console.log('Notification permission denied');
+        return;
+    }
+    
+    createNotification(alert);
+}
+
+function createNotification(alert) {
+    console.log('Creating notification for alert:', alert.title);
+    
+    // Determine urgency based on severity
+    const isCritical = alert.severity === 'critical' || alert.severity === 'high';
+    const urgency = isCritical ? 'critical' : 'normal';
+    
+    const notification = new Notification(`🔥 ${alert.severity.toUpperCase()} FIRE ALERT 🔥`, {
+        body: isCritical ? `🚨 CRITICAL: ${alert.message} - IMMEDIATE ACTION REQUIRED 🚨` : alert.message,
+        icon: '/static/icons/icon-192.png',
+        badge: '/static/icons/icon-192.png',
+        tag: `alert-${alert.id}`,
+        requireInteraction: true, // Force user interaction
+        silent: false, // Ensure sound plays
+        vibrate: isCritical ? 
+            [2000, 1000, 2000, 1000, 2000, 1000, 2000, 1000, 2000] : // Aggressive pattern for critical
+            [1000, 500, 1000, 500, 1000], // Standard pattern for others
+        data: { 
+            alertId: alert.id,
+            severity: alert.severity,
+            urgency: urgency,
+            timestamp: Date.now()
+        },
+        actions: [
+            {
+                action: 'view',
+                title: '🚨 VIEW DETAILS',
+                icon: '/static/icons/icon-192.png'
+            },
+            {
+                action: 'dismiss',
+                title: 'Dismiss',
+                icon: '/static/icons/icon-192.png'
+            }
+        ],
+        renotify: true, // Always show even if same tag
+        dir: 'ltr',
+        lang: 'en-US'
+    });
+    
+    // Play emergency sound for critical alerts
+    if (isCritical) {
+        try {
+            // Create audio context for emergency sound
+            const audioContext = new (window.AudioContext || window.webkitAudioContext)();
+            const oscillator = audioContext.createOscillator();
+            const gainNode = audioContext.createGain();
+            
+            oscillator.connect(gainNode);
+            gainNode.connect(audioContext.destination);
+            
+            // Create emergency siren pattern
+            oscillator.frequency.setValueAtTime(800, audioContext.currentTime);
+            oscillator.frequency.setValueAtTime(600, audioContext.currentTime + 0.2);
+            oscillator.frequency.setValueAtTime(800, audioContext.currentTime + 0.4);
+            oscillator.frequency.setValueAtTime(600, audioContext.currentTime + 0.6);
+            oscillator.frequency.setValueAtTime(800, audioContext.currentTime + 0.8);
+            
+            gainNode.gain.setValueAtTime(0.4, audioContext.currentTime);
+            gainNode.gain.exponentialRampToValueAtTime(0.01, audioContext.currentTime + 1.0);
+            
+            oscillator.start(audioContext.currentTime);
+            oscillator.stop(audioContext.currentTime + 1.0);
+        } catch (error) {
+            console.log('Audio context not available:', error);
+        }
+    }
+    
+    notification.onclick = function() {
+        console.log('Notification clicked, focusing window and showing alerts tab');
+        window.focus();
+        showTab('alerts');
+        notification.close();
+        
+        // For critical alerts, also trigger additional attention
+        if (isCritical) {
+            // Flash the screen briefly
+            document.body.style.transition = 'background-color 0.1s';
+            document.body.style.backgroundColor = '#ff0000';
+            setTimeout(() => {
+                document.body.style.backgroundColor = '';
+            }, 200);
+            
+            // Show additional in-app alert
+            showCriticalAlertModal(alert);
+        }
+    };
+    
+    notification.onshow = function() {
+        console.log('Notification shown successfully');
+        
+        // For critical alerts, show additional in-app notification
+        if (isCritical) {
+            showInAppCriticalAlert(alert);
+        }
+    };
+    
+    notification.onerror = function(error) {
+        console.error('Notification error:', error);
+    };
+    
+    // For critical alerts, set up reminder notifications
+    if (isCritical) {
+        setTimeout(() => {
+            // Check if user has interacted with the app
+            if (!document.hasFocus()) {
+                // Show reminder notification
+                const reminderNotification = new Notification('⚠️ CRITICAL FIRE ALERT - ACTION REQUIRED ⚠️', {
+                    body: 'You have an active critical fire alert that requires immediate attention',
+                    icon: '/static/icons/icon-192.png',
+                    badge: '/static/icons/icon-192.png',
+                    tag: `reminder-${alert.id}`,
+                    requireInteraction: true,
+                    silent: false,
+                    vibrate: [3000, 1500, 3000, 1500, 3000],
+                    data: { type: 'reminder', alertId: alert.id }
+                });
+                
+                reminderNotification.onclick = function() {
+                    window.focus();
+                    showTab('alerts');
+                    reminderNotification.close();
+                };
+            }
+        }, 30000); // 30 seconds
+    }
+}
+
+// Show critical alert modal for maximum attention
+function showCriticalAlertModal(alert) {
+    // Remove any existing modal
+    const existingModal = document.getElementById('criticalAlertModal');
+    if (existingModal) {
+        existingModal.remove();
+    }
+    
+    const modal = document.createElement('div');
+    modal.id = 'criticalAlertModal';
+    modal.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background: rgba(255, 0, 0, 0.9);
+        z-index: 10000;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        animation: pulse 1s infinite;
+    `;
+    
+    modal.innerHTML = `
+        <div style="
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            text-align: center;
+            max-width: 90%;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.5);
+        ">
+            <h1 style="color: #d32f2f; font-size: 24px; margin-bottom: 15px;">
+                🚨 CRITICAL FIRE ALERT 🚨
+            </h1>
+            <p style="font-size: 18px; margin-bottom: 20px; color: #333;">
+                ${alert.message}
+            </p>
+            <button onclick="this.parentElement.parentElement.remove(); showTab('alerts');" 
+                    style="
+                        background: #d32f2f;
+                        color: white;
+                        border: none;
+                        padding: 15px 30px;
+                        border-radius: 8px;
+                        font-size: 16px;
+                        cursor: pointer;
+                        font-weight: bold;
+                    ">
+                VIEW ALERT DETAILS
+            </button>
+        </div>
+    `;
+    
+    document.body.appendChild(modal);
+    
+    // Auto-remove after 10 seconds
+    setTimeout(() => {
+        if (modal.parentNode) {
+            modal.remove();
+        }
+    }, 10000);
+}
+
+// Show in-app critical alert banner
+function showInAppCriticalAlert(alert) {
+    // Remove any existing banner
+    const existingBanner = document.getElementById('criticalAlertBanner');
+    if (existingBanner) {
+        existingBanner.remove();
+    }
+    
+    const banner = document.createElement('div');
+    banner.id = 'criticalAlertBanner';
+    banner.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        right: 0;
+        background: linear-gradient(45deg, #ff0000, #d32f2f);
+        color: white;
+        padding: 15px;
+        text-align: center;
+        z-index: 9999;
+        font-weight: bold;
+        font-size: 16px;
+        animation: slideDown 0.5s ease-out;
+        box-shadow: 0 4px 12px rgba(255,0,0,0.3);
+    `;
+    
+    banner.innerHTML = `
+        🚨 CRITICAL FIRE ALERT: ${alert.title} - CLICK TO VIEW DETAILS 🚨
+    `;
+    
+    banner.onclick = function() {
+        showTab('alerts');
+        banner.remove();
+    };
+    
+    document.body.appendChild(banner);
+    
+    // Auto-remove after 30 seconds
+    setTimeout(() => {
+        if (banner.parentNode) {
+            banner.remove();
+        }
+    }, 30000);
+}
+
+// Listen for messages from service worker
+navigator.serviceWorker.addEventListener('message', (event) => {
+    console.log('Message from service worker:', event.data);
+    
+    if (event.data.type === 'showAlertsTab') {
+        showTab('alerts');
+    }
+});
+
+// Check for new alerts periodically
@@ -0,0 +1,47 @@
+// Firebase web SDK bindings, exposed on window for app.js
+import { initializeApp } from 'https://www.gstatic.com/firebasejs/9.22.2/firebase-app.js';
+import { getMessaging, getToken, onMessage } from 'https://www.gstatic.com/firebasejs/9.22.2/firebase-messaging.js';
+
+// Make Firebase available globally
+window.firebaseApp = null;
+window.firebaseMessaging = null;
+window.initializeFirebaseApp = function(config) {
+    try {
+        window.firebaseApp = initializeApp(config.firebase);
+        window.firebaseMessaging = getMessaging(window.firebaseApp);
+        console.log('Firebase initialized successfully');
+        return true;
+    } catch (error) {
+        console.error('Firebase initialization failed:', error);
+        return false;
+    }
+};
+
+window.getFirebaseToken = async function(vapidKey) {
+    if (!window.firebaseMessaging) return null;
+    try {
+        const permission = await Notification.requestPermission();
+        if (permission === 'granted') {
+            const token = await getToken(window.firebaseMessaging, { vapidKey });
+            console.log('FCM Token:', token);
+            return token;
+        } else {
+            console.log('Notification permission denied');
+            return null;
+        }
+    } catch (error) {
+        console.error('Error getting Firebase token:', error);
+        return null;
+    }
+};
+
+window.setupFirebaseMessaging = function(onMessageCallback) {
+    if (!window.firebaseMessaging) return;
+    
+    onMessage(window.firebaseMessaging, (payload) => {
+        console.log('Message received in foreground:', payload);
+        if (onMessageCallback) {
+            onMessageCallback(payload);
+        }
+    });
+};
@@ -1,16 +1,27 @@
 // sw.js - Service Worker for Ranch Fire Alert PWA
-const CACHE_VERSION = '1.0.2';
+
+// Precache list and build id generated by build_assets.py from the fingerprinted asset set
+try {
+    importScripts('/static/dist/precache-manifest.js');
+} catch (error) {
+    console.log('No generated precache manifest (run build_assets.py), using the source assets:', error);
+}
+
+const APP_VERSION = '1.0.6';
+const CACHE_VERSION = `${APP_VERSION}-${self.PRECACHE_BUILD_ID || 'dev'}`;
 const CACHE_NAME = `ranch-fire-alert-v${CACHE_VERSION}`;
 const STATIC_CACHE = `ranch-fire-alert-static-v${CACHE_VERSION}`;
 const DYNAMIC_CACHE = `ranch-fire-alert-dynamic-v${CACHE_VERSION}`;
 
 // Assets to cache immediately
-const STATIC_ASSETS = [
+const STATIC_ASSETS = self.PRECACHE_ASSETS || [
     '/',
     '/static/manifest.json',
+    '/static/css/app.css',
+    '/static/js/app.js',
+    '/static/js/firebase-init.js',
     '/static/icons/icon-192.png',
-    '/static/icons/icon-512.png',
-    '/static/images/dmr-ranch-backfground.jpg'
+    '/static/icons/icon-512.png'
 ];
 
 // Assets to cache on demand
@@ -19,6 +30,11 @@ const DYNAMIC_ASSETS = [
     '/api/config'
 ];
 
+// Sync and pagination URLs are unique per call; caching them would only grow the cache
+const UNCACHED_API_PARAMS = ['since', 'cursor'];
+// Upper bound on cached API responses; the oldest are dropped first
+const DYNAMIC_CACHE_MAX_ENTRIES = 50;
+
 // Install event - cache static resources
 self.addEventListener('install', (event) => {
     console.log(`Service Worker installing... Version ${CACHE_VERSION}`);
@@ -91,6 +107,16 @@ self.addEventListener('fetch', (event) => {
     
     const url = new URL(request.url);
     
+    // Let the browser handle the live alert stream directly; it must never be cached
+    if (url.pathname === '/api/alerts/stream') {
+        return;
+    }
+    
+    // History exports stream straight to disk; caching a copy would buffer the whole file
+    if (url.pathname.startsWith('/api/admin/export/')) {
+        return;
+    }
+    
     // Handle API requests with network-first strategy
     if (url.pathname.startsWith('/api/')) {
         event.respondWith(handleApiRequest(request));
@@ -113,16 +139,35 @@ self.addEventListener('fetch', (event) => {
     event.respondWith(handleDefaultRequest(request));
 });
 
-// API request handler - network first, cache fallback
+// API request handler - network first (revalidating with the cached ETag), cache fallback
 async function handleApiRequest(request) {
+    const url = new URL(request.url);
+    if (UNCACHED_API_PARAMS.some((param) => url.searchParams.has(param))) {
+        return handleUncachedApiRequest(request);
+    }
+    
     try {
-        // Try network first
-        const networkResponse = await fetch(request);
+        const cache = await caches.open(DYNAMIC_CACHE);
+        const cachedResponse = await cache.match(request);
+        const cachedEtag = cachedResponse && cachedResponse.headers.get('ETag');
+        
+        // Send the validator we hold so the server can answer 304 without rebuilding the list
+        let networkRequest = request;
+        if (cachedEtag) {
+            const headers = new Headers(request.headers);
+            headers.set('If-None-Match', cachedEtag);
+            networkRequest = new Request(request, { headers });
+        }
+        
+        const networkResponse = await fetch(networkRequest);
+        
+        if (networkResponse.status === 304 && cachedResponse) {
+            return cachedResponse;
+        }
         
         // Cache successful responses
         if (networkResponse.ok) {
-            const cache = await caches.open(DYNAMIC_CACHE);
-            cache.put(request, networkResponse.clone());
+            cache.put(request, networkResponse.clone()).then(() => trimCache(cache, DYNAMIC_CACHE_MAX_ENTRIES));
         }
         
         return networkResponse;
@@ -135,24 +180,43 @@ async function handleApiRequest(request) {
             return cachedResponse;
         }
         
-        // Return offline response
-        return new Response(
-            JSON.stringify({ 
-                error: 'You are offline. Please check your connection.',
-                offline: true,
-                timestamp: new Date().toISOString()
-            }),
-            {
-                status: 503,
-                headers: { 
-                    'Content-Type': 'application/json',
-                    'Cache-Control': 'no-cache'
-                }
-            }
-        );
+        return offlineApiResponse();
+    }
+}
+
+// Sync and pagination requests - network only, never cached
+async function handleUncachedApiRequest(request) {
+    try {
+        return await fetch(request);
+    } catch (error) {
+        console.log('API request failed:', error);
+        return offlineApiResponse();
     }
 }
 
+function offlineApiResponse() {
+    return new Response(
+        JSON.stringify({ 
+            error: 'You are offline. Please check your connection.',
+            offline: true,
+            timestamp: new Date().toISOString()
+        }),
+        {
+            status: 503,
+            headers: { 
+                'Content-Type': 'application/json',
+                'Cache-Control': 'no-cache'
+            }
+        }
+    );
+}
+
+// Drop the oldest entries (cache keys come back in insertion order) beyond maxEntries
+async function trimCache(cache, maxEntries) {
+    const keys = await cache.keys();
+    await Promise.all(keys.slice(0, Math.max(0, keys.length - maxEntries)).map((key) => cache.delete(key)));
+}
+
 // Static asset handler - cache first, network fallback
 async function handleStaticRequest(request) {
     const cachedResponse = await caches.match(request);
@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py keeps its database under ./data, so import it from a scratch directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(tempfile.mkdtemp(prefix='ranch-fire-alert-tests-'))
+
+import app as app_module  # noqa: E402
+
+@pytest.fixture(scope='session')
+def m():
+    """The app module once its background startup has created the schema"""
+    app_module.startup.begin(app_module.run_startup)
+    assert app_module.startup.ready.wait(30), 'startup did not finish'
+    return app_module
+
+@pytest.fixture
+def client(m):
+    return m.app.test_client()
+
+@pytest.fixture
+def admin(m):
+    """(id, ranch_id) of the seeded admin user"""
+    with m.app.app_context():
+        user = m.User.query.filter_by(is_admin=True).first()
+        return user.id, user.ranch_id
@@ -0,0 +1,31 @@
+import pytest
+
+@pytest.mark.parametrize('latitude, longitude', [
+    (95, -110),
+    (-91, -110),
+    (32, -400),
+    (32, 181),
+    ('nan', -110),
+    (32, 'inf'),
+    ('abc', -110),
+    (32, None),
+])
+def test_create_alert_rejects_invalid_location(m, client, admin, latitude, longitude):
+    admin_id, _ = admin
+    with m.app.app_context():
+        before = m.FireAlert.query.count()
+    response = client.post('/api/alerts', json={
+        'title': 'Smoke', 'message': 'Smoke near the gate', 'user_id': admin_id,
+        'latitude': latitude, 'longitude': longitude
+    })
+    assert response.status_code == 400
+    with m.app.app_context():
+        assert m.FireAlert.query.count() == before
+
+def test_create_alert_accepts_location_on_the_bounds(client, admin):
+    admin_id, _ = admin
+    response = client.post('/api/alerts', json={
+        'title': 'Smoke', 'message': 'Smoke near the gate', 'user_id': admin_id,
+        'latitude': -90, 'longitude': 180
+    })
+    assert response.status_code == 200, response.get_json()
@@ -0,0 +1,39 @@
+"""Writes must move the version counters behind every ETag that shows them."""
+
+def test_home_location_change_invalidates_admin_user_list(client, admin):
+    admin_id, _ = admin
+    url = f'/api/admin/users?user_id={admin_id}'
+    etag = client.get(url).headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    response = client.put(f'/api/users/{admin_id}/location?user_id={admin_id}', json={'latitude': 31.95, 'longitude': -109.95})
+    assert response.status_code == 200
+
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    listed = next(user for user in response.get_json()['users'] if user['id'] == admin_id)
+    assert (listed['home_latitude'], listed['home_longitude']) == (31.95, -109.95)
+
+def test_login_keeps_cached_feeds_valid(client, admin):
+    admin_id, _ = admin
+    feeds = [f'/api/alerts?user_id={admin_id}', '/api/alerts', '/api/ranches']
+    etags = {url: client.get(url).headers['ETag'] for url in feeds}
+
+    response = client.post('/api/login', json={'identifier': 'admin@ranch.local', 'password': 'admin123', 'fcm_token': 'token-1'})
+    assert response.status_code == 200, response.get_json()
+
+    for url, etag in etags.items():
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304, url
+
+def test_login_invalidates_admin_user_list(client, admin):
+    admin_id, _ = admin
+    url = f'/api/admin/users?user_id={admin_id}'
+    etag = client.get(url).headers['ETag']
+
+    response = client.post('/api/login', json={'identifier': 'admin@ranch.local', 'password': 'admin123'})
+    assert response.status_code == 200, response.get_json()
+
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    listed = next(user for user in response.get_json()['users'] if user['id'] == admin_id)
+    assert listed['last_login'] is not None
@@ -0,0 +1,18 @@
+import pytest
+
+@pytest.mark.parametrize('path', ['/api/admin/export/alerts', '/api/admin/export/livestock-requests'])
+@pytest.mark.parametrize('ranch_id', ['abc', '', '1.5', '999999'])
+def test_export_rejects_invalid_ranch_id(client, admin, path, ranch_id):
+    admin_id, _ = admin
+    response = client.get(f'{path}?user_id={admin_id}&ranch_id={ranch_id}')
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+def test_export_filters_by_ranch(client, admin):
+    admin_id, ranch_id = admin
+    response = client.get(f'/api/admin/export/alerts?user_id={admin_id}&ranch_id={ranch_id}&format=csv')
+    try:
+        assert response.status_code == 200
+        assert response.get_data(as_text=True).startswith('id,ranch_id,')
+    finally:
+        response.close()
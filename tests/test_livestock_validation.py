@@ -0,0 +1,21 @@
+import pytest
+
+@pytest.mark.parametrize('animal_count', ['abc', '2.5', -3, '-3', [5], {'head': 5}])
+def test_create_livestock_request_rejects_invalid_count(m, client, admin, animal_count):
+    admin_id, _ = admin
+    with m.app.app_context():
+        before = m.LivestockRequest.query.count()
+    response = client.post('/api/livestock-requests', json={
+        'user_id': admin_id, 'animal_type': 'cattle', 'animal_count': animal_count, 'details': 'Need a trailer'
+    })
+    assert response.status_code == 400
+    with m.app.app_context():
+        assert m.LivestockRequest.query.count() == before
+
+def test_create_livestock_request_accepts_numeric_string_count(client, admin):
+    admin_id, _ = admin
+    response = client.post('/api/livestock-requests', json={
+        'user_id': admin_id, 'animal_type': 'cattle', 'animal_count': '12', 'details': 'Need a trailer'
+    })
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()['request']['animal_count'] == 12
@@ -0,0 +1,85 @@
+"""The list endpoints load relationships in batches, so the number of SQL
+statements per request must not grow with the number of rows returned."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+@contextmanager
+def count_statements(m):
+    """Count statements sent to the writer and the read pool"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with m.app.app_context():
+        engines = (m.db.engine, m.reader_engine)
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+def add_ranch_rows(m, count):
+    """A new ranch with count users, each with an alert, a shared alert and a livestock request"""
+    with m.app.app_context():
+        ranch = m.Ranch(name=f'Query Count Ranch {datetime.utcnow().timestamp()}', latitude=32.0, longitude=-110.0)
+        other = m.Ranch(name=f'Sharing Ranch {datetime.utcnow().timestamp()}', latitude=32.1, longitude=-110.1)
+        m.db.session.add_all([ranch, other])
+        m.db.session.flush()
+        # Newer than anything else in the database, so these rows head every admin list page
+        started = datetime.utcnow() + timedelta(days=1)
+        for i in range(count):
+            user = m.User(name=f'Rancher {ranch.id}-{i}', email=f'rancher{ranch.id}-{i}@ranch.local', ranch_id=ranch.id)
+            m.db.session.add(user)
+            m.db.session.flush()
+            at = started + timedelta(minutes=i)
+            own = m.FireAlert(title=f'Own {i}', message='m', ranch_id=ranch.id, created_by=user.id, created_at=at, updated_at=at)
+            shared = m.FireAlert(title=f'Shared {i}', message='m', ranch_id=other.id, created_by=user.id, created_at=at, updated_at=at)
+            m.db.session.add_all([own, shared])
+            m.db.session.flush()
+            m.db.session.add(m.AlertRanch(alert_id=shared.id, ranch_id=ranch.id))
+            m.db.session.add(m.LivestockRequest(user_id=user.id, ranch_id=ranch.id, animal_type='cattle', animal_count=10,
+                                                details='d', created_at=at))
+        # Rows were added directly, so recount to keep the counters true for other tests
+        m.rebuild_stats()
+        m.bump_versions(ranch.id, other.id)
+        m.db.session.commit()
+        return m.db.session.query(m.User.id).filter_by(ranch_id=ranch.id).first()[0]
+
+def statements_for(m, client, url):
+    with count_statements(m) as statements:
+        response = client.get(url)
+    assert response.status_code == 200, response.get_json()
+    return len(statements)
+
+@pytest.mark.parametrize('path, rows_key, expected', [
+    ('/api/alerts', 'alerts', 8),
+    ('/api/livestock-requests', 'requests', 4),
+])
+def test_ranch_lists_use_fixed_statement_count(m, client, path, rows_key, expected):
+    counts = []
+    for rows in (3, 30):
+        user_id = add_ranch_rows(m, rows)
+        url = f'{path}?user_id={user_id}&limit=100'
+        assert len(client.get(url).get_json()[rows_key]) >= rows
+        counts.append(statements_for(m, client, url))
+    assert counts == [expected, expected]
+
+@pytest.mark.parametrize('path, expected', [
+    ('/api/admin/users', 4),
+    ('/api/admin/alerts', 7),
+])
+def test_admin_lists_use_fixed_statement_count(m, client, admin, path, expected):
+    admin_id, _ = admin
+    url = f'{path}?user_id={admin_id}&limit=200'
+    counts = []
+    for rows in (3, 30):
+        add_ranch_rows(m, rows)
+        counts.append(statements_for(m, client, url))
+    assert counts == [expected, expected]
@@ -0,0 +1,26 @@
+"""Clients have always been allowed to send ranch_id as a string."""
+
+def test_register_accepts_string_ranch_id(m, client, admin):
+    _, ranch_id = admin
+    response = client.post('/api/register', json={
+        'name': 'String Ranch Id', 'email': 'string-ranch-id@ranch.local', 'password': 'pasture-gate', 'ranch_id': str(ranch_id)
+    })
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()['user']['ranch_id'] == ranch_id
+
+def test_create_alert_accepts_string_ranch_id(m, client, admin):
+    admin_id, ranch_id = admin
+    response = client.post('/api/alerts', json={
+        'title': 'Smoke', 'message': 'Smoke near the gate', 'user_id': admin_id, 'ranch_id': str(ranch_id)
+    })
+    assert response.status_code == 200, response.get_json()
+    assert ranch_id in response.get_json()['alert']['ranch_ids']
+
+def test_non_numeric_ranch_id_is_rejected(client, admin):
+    admin_id, _ = admin
+    assert client.post('/api/register', json={
+        'name': 'Bad Ranch Id', 'email': 'bad-ranch-id@ranch.local', 'password': 'pasture-gate', 'ranch_id': 'north'
+    }).status_code == 400
+    assert client.post('/api/alerts', json={
+        'title': 'Smoke', 'message': 'm', 'user_id': admin_id, 'ranch_id': 'north'
+    }).status_code == 400
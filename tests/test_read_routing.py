@@ -0,0 +1,77 @@
+"""Read-only paths must stay on the read pool: the writer is a single
+connection, and a stray BEGIN IMMEDIATE there stalls every write."""
+
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+@contextmanager
+def writer_statements(m):
+    """Statements this thread sends to the writer (background writers are ignored)"""
+    statements = []
+    thread = threading.get_ident()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == thread:
+            statements.append(statement)
+
+    with m.app.app_context():
+        engine = m.db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+def add_located_alert(m, admin_id, ranch_id):
+    with m.app.app_context():
+        alert = m.FireAlert(title='Located smoke', message='m', ranch_id=ranch_id, created_by=admin_id,
+                            latitude=31.92, longitude=-109.96)
+        m.db.session.add(alert)
+        m.db.session.flush()
+        m.track_alert_stats(after=m.alert_state(alert))
+        m.bump_versions(ranch_id)
+        m.db.session.commit()
+        return alert.id
+
+def test_nearby_alerts_never_touch_the_writer(m, client, admin):
+    alert_id = add_located_alert(m, *admin)
+    m.known_rtrees.clear()
+    with writer_statements(m) as statements:
+        response = client.get('/api/alerts/nearby?lat=31.92&lon=-109.96&radius=5')
+    assert response.status_code == 200
+    assert alert_id in [alert['id'] for alert in response.get_json()['alerts']]
+    assert statements == []
+
+def test_notification_targeting_never_touches_the_writer(m, admin):
+    alert_id = add_located_alert(m, *admin)
+    m.known_rtrees.clear()
+    with m.app.app_context():
+        alert = m.db.session.get(m.FireAlert, alert_id)
+        with writer_statements(m) as statements:
+            m.notification_tokens(alert)
+    assert statements == []
+    assert 'user_home_rtree' in m.known_rtrees
+
+def test_admin_edit_hashes_before_touching_the_writer(m, client, admin, monkeypatch):
+    admin_id, ranch_id = admin
+    with m.app.app_context():
+        user = m.User(name='Edited', email='edited@ranch.local', ranch_id=ranch_id)
+        m.db.session.add(user)
+        m.db.session.commit()
+        edited_id = user.id
+    hash_password = m.password_hasher.hash
+    writes_before_hash = []
+
+    with writer_statements(m) as statements:
+        def hash_after_checking(password):
+            writes_before_hash.extend(statements)
+            return hash_password(password)
+        monkeypatch.setattr(m.password_hasher, 'hash', hash_after_checking)
+        response = client.put(f'/api/admin/users/{edited_id}?user_id={admin_id}', json={
+            'name': 'Renamed', 'email': 'renamed@ranch.local', 'password': 'new-secret'})
+    assert response.status_code == 200
+    assert writes_before_hash == []
+    login = client.post('/api/login', json={'identifier': 'renamed@ranch.local', 'password': 'new-secret'})
+    assert login.get_json()['success']
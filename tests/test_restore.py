@@ -0,0 +1,51 @@
+"""Restores run from a separate process (docker-run.sh restore), so they are
+exercised here the same way, each against its own scratch database."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+from conftest import ROOT
+
+RESTORE_SCRIPT = textwrap.dedent('''
+    import sqlite3
+    import subprocess
+    import sys
+    sys.path.insert(0, sys.argv[1])
+    import app as m
+
+    m.create_tables()
+    with m.app.app_context():
+        backup = m.backup_database()
+        ranches = m.Ranch.query.count()
+        m.db.session.add(m.Ranch(name='Added after the backup', latitude=32.0, longitude=-110.0))
+        m.db.session.commit()
+        m.db.session.remove()
+
+        # Another process with the database open, as a running web server would have
+        holder = subprocess.Popen([sys.executable, '-c', (
+            'import sqlite3, sys, time; c = sqlite3.connect(sys.argv[1]); '
+            'c.execute("select count(*) from ranch").fetchall(); print("open", flush=True); time.sleep(30)'
+        ), m.sqlite_path], stdout=subprocess.PIPE)
+        holder.stdout.readline()
+        try:
+            print('while open:', m.restore_database(backup))
+        finally:
+            holder.kill()
+            holder.wait()
+        print('when closed:', m.restore_database(backup))
+        print('ranches back to backup:', m.Ranch.query.count() == ranches)
+''')
+
+def test_restore_refuses_while_another_process_has_the_database_open(tmp_path):
+    result = subprocess.run([sys.executable, '-c', RESTORE_SCRIPT, ROOT], cwd=tmp_path,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == [
+        'while open: False',
+        'when closed: True',
+        'ranches back to backup: True',
+    ], result.stdout + result.stderr
+    assert 'Database is in use' in result.stderr
+    assert not os.path.exists(tmp_path / 'data' / 'fire_alerts.db.restore')
@@ -0,0 +1,65 @@
+"""Materialized counters must match the base tables when the same alert is
+changed by several requests at once."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+CONCURRENT_REQUESTS = 8
+
+def add_alerts(m, admin_id, ranch_id, count):
+    with m.app.app_context():
+        alerts = [m.FireAlert(title=f'Race {i}', message='m', ranch_id=ranch_id, created_by=admin_id) for i in range(count)]
+        m.db.session.add_all(alerts)
+        m.db.session.flush()
+        for alert in alerts:
+            m.track_alert_stats(after=m.alert_state(alert))
+        m.bump_versions(ranch_id)
+        m.db.session.commit()
+        return [alert.id for alert in alerts]
+
+def counted_and_actual(m, ranch_id):
+    """(counters, COUNT(*) from fire_alert) for the ranch and globally"""
+    with m.app.app_context():
+        m.db.session.remove()
+        result = {}
+        for scope, query in ((ranch_id, m.FireAlert.query.filter_by(ranch_id=ranch_id)), (None, m.FireAlert.query)):
+            actual = {
+                'total': query.count(),
+                'active': query.filter(m.FireAlert.status == 'active').count(),
+                'resolved': query.filter(m.FireAlert.status == 'resolved').count(),
+                'critical': query.filter(m.FireAlert.severity == 'critical').count(),
+            }
+            result[scope] = (m.alert_counts(scope), actual)
+        return result
+
+def hammer(m, requests):
+    """Send each (method, url) CONCURRENT_REQUESTS times at once"""
+    def send(call):
+        method, url = call
+        return getattr(m.app.test_client(), method)(url).status_code
+
+    with ThreadPoolExecutor(CONCURRENT_REQUESTS) as pool:
+        return list(pool.map(send, [call for call in requests for _ in range(CONCURRENT_REQUESTS)]))
+
+def assert_counters_match(m, ranch_id):
+    for scope, (counted, actual) in counted_and_actual(m, ranch_id).items():
+        assert counted == actual, f"stats for {scope or 'global'} drifted"
+
+@pytest.mark.parametrize('action', ['resolve', 'reopen'])
+def test_concurrent_status_changes_keep_counters_exact(m, admin, action):
+    admin_id, ranch_id = admin
+    alert_ids = add_alerts(m, admin_id, ranch_id, 10)
+    if action == 'reopen':
+        hammer(m, [('post', f'/api/admin/alerts/{alert_id}/resolve?user_id={admin_id}') for alert_id in alert_ids])
+    statuses = hammer(m, [('post', f'/api/admin/alerts/{alert_id}/{action}?user_id={admin_id}') for alert_id in alert_ids])
+    assert set(statuses) == {200}
+    assert_counters_match(m, ranch_id)
+
+def test_concurrent_deletes_keep_counters_exact(m, admin):
+    admin_id, ranch_id = admin
+    alert_ids = add_alerts(m, admin_id, ranch_id, 10)
+    statuses = hammer(m, [('delete', f'/api/alerts/{alert_id}') for alert_id in alert_ids])
+    assert statuses.count(200) == len(alert_ids)
+    assert set(statuses) == {200, 404}
+    assert_counters_match(m, ranch_id)
@@ -0,0 +1,21 @@
+def test_global_sync_reports_a_shared_alert_delete_once(m, client, admin):
+    admin_id, ranch_id = admin
+    with m.app.app_context():
+        neighbour = m.Ranch(name='Sync Neighbour Ranch', latitude=32.0, longitude=-110.0)
+        m.db.session.add(neighbour)
+        m.db.session.flush()
+        alert = m.FireAlert(title='Shared smoke', message='m', ranch_id=ranch_id, created_by=admin_id)
+        m.db.session.add(alert)
+        m.db.session.flush()
+        m.db.session.add(m.AlertRanch(alert_id=alert.id, ranch_id=neighbour.id))
+        m.db.session.flush()
+        m.track_alert_stats(after=m.alert_state(alert))
+        m.bump_versions(ranch_id, neighbour.id)
+        m.db.session.commit()
+        alert_id = alert.id
+
+    cursor = client.get('/api/alerts').get_json()['cursor']
+    assert client.delete(f'/api/alerts/{alert_id}').status_code == 200
+
+    changes = client.get(f'/api/alerts?since={cursor}').get_json()
+    assert [deleted['id'] for deleted in changes['deleted']] == [alert_id]